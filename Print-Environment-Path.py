@@ -4,7 +4,7 @@
  Program: Print the path of the environment in a pretty way.
     Name: Andrew Dixon            File: Print-Environment-Path.py
     Date: 11 Nov 2025
-   Notes:
+   Notes: Thin wrapper around useful_scripts.env_path (also "useful-scripts env-path").
 
    Copyright (c) 2026 Andrew Dixon
 
@@ -15,6 +15,10 @@
 ........1.........2.........3.........4.........5.........6.........7.........8.........9.........0.........1
 """
 
-import os
+from useful_scripts.env_path import main
 
-print(os.environ['PATH'].replace(':','\n'))
+# If the Print-Environment-Path.py is run (instead of imported as a module),
+#   call the main() function:
+if __name__ == '__main__':
+  # Return the exit code to the OS.
+  raise SystemExit(main())
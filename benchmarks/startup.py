@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""
+ Program: Startup benchmark for the useful-scripts command line
+    Name: Andrew Dixon            File: startup.py
+    Date: 19 Oct 2026
+   Notes: Runs "python -X importtime -m useful_scripts <command> --help" a few times per
+          subcommand, keeps the best wall time, counts the modules imported, and checks that
+          only the invoked subcommand's module was loaded. Exits non-zero when a budget in
+          BUDGETS is exceeded, so it can guard against import creep. Time and import counts
+          are reported above a bare "python -c pass" baseline, which varies with the machine.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import argparse
+import subprocess
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Command name -> (ms and modules allowed beyond the bare interpreter). '' is "useful-scripts"
+# with no subcommand. Set with headroom over measured values.
+BUDGETS: dict[str, tuple[float, int]] = {
+  '': (25.0, 8),
+  'bootstrap': (90.0, 50),
+  'env-path': (90.0, 45),
+  'wol': (90.0, 50),
+}
+
+SUBCOMMAND_MODULES = {
+  'bootstrap': 'useful_scripts.bootstrap',
+  'env-path': 'useful_scripts.env_path',
+  'wol': 'useful_scripts.wol',
+}
+
+
+def measureRun(commandParts: list[str], repeatCount: int) -> tuple[float, list[str]]:
+  """Return the best wall time in ms and the modules imported by one run of the command."""
+  bestMs = float('inf')
+  importedModules: list[str] = []
+  for _ in range(repeatCount):
+    startNs = time.perf_counter_ns()
+    resultObj = subprocess.run(
+      commandParts, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+      text=True, check=False,
+    )
+    bestMs = min(bestMs, (time.perf_counter_ns() - startNs) / 1e6)
+
+    # importtime lines look like "import time:   self |  cumulative | [indent]name".
+    importedModules = [
+      lineText.rsplit('|', 1)[1].strip()
+      for lineText in resultObj.stderr.splitlines()
+      if lineText.startswith('import time:') and not lineText.rstrip().endswith('imported package')
+    ]
+
+  return bestMs, importedModules
+
+
+def measureCommand(commandName: str, repeatCount: int) -> tuple[float, list[str]]:
+  commandParts = [sys.executable, '-X', 'importtime', '-m', 'useful_scripts']
+  if commandName:
+    commandParts += [commandName, '--help']
+
+  return measureRun(commandParts, repeatCount)
+
+
+def main() -> int:
+  parser = argparse.ArgumentParser(description='Measure useful-scripts start-up cost.')
+  parser.add_argument('--repeat', type=int, default=7, help='Runs per command; the best counts.')
+  args = parser.parse_args()
+
+  baselineMs, baselineModules = measureRun(
+    [sys.executable, '-X', 'importtime', '-c', 'pass'], args.repeat
+  )
+  baselineSet = set(baselineModules)
+  print(f'Interpreter baseline: {baselineMs:.1f} ms, {len(baselineSet)} modules\n')
+
+  failureCount = 0
+  print(f'{"command":<12} {"+ms":>9} {"budget":>8} {"+imports":>8} {"budget":>7}')
+  for commandName, (budgetMs, budgetImports) in BUDGETS.items():
+    bestMs, importedModules = measureCommand(commandName, args.repeat)
+    extraMs = max(bestMs - baselineMs, 0.0)
+    importCount = len(set(importedModules) - baselineSet)
+
+    problemList: list[str] = []
+    if extraMs > budgetMs:
+      problemList.append('slow')
+    if importCount > budgetImports:
+      problemList.append('too many imports')
+
+    expectedModule = SUBCOMMAND_MODULES.get(commandName)
+    strayModules = sorted(
+      moduleName for moduleName in importedModules
+      if moduleName in SUBCOMMAND_MODULES.values() and moduleName != expectedModule
+    )
+    if strayModules:
+      problemList.append('loaded ' + ', '.join(strayModules))
+
+    failureCount += bool(problemList)
+    print(
+      f'{commandName or "(none)":<12} {extraMs:>9.1f} {budgetMs:>8.0f} {importCount:>8} '
+      f'{budgetImports:>7}  {"; ".join(problemList) or "ok"}'
+    )
+
+  return 1 if failureCount else 0
+
+
+if __name__ == '__main__':
+  raise SystemExit(main())
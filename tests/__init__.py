@@ -0,0 +1,12 @@
+"""
+ Program: Useful_Scripts tests
+    Name: Andrew Dixon            File: __init__.py
+    Date: 19 Oct 2026
+   Notes: Standard library unittest only; run "python -m unittest" from the project root.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
@@ -0,0 +1,265 @@
+"""
+ Program: Tests for Project-Bootstrap
+    Name: Andrew Dixon            File: test_bootstrap.py
+    Date: 19 Oct 2026
+   Notes: Merges, the concurrent template pipeline and plans, on in-memory lines and temp
+          projects.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
+
+import io
+import os
+import json
+import time
+import tomllib
+import tempfile
+import unittest
+import contextlib
+from pathlib import Path
+from unittest import mock
+
+from useful_scripts import bootstrap
+
+MARKER_LINE = f'# {bootstrap.MERGE_MARKER}\n'
+
+TEMPLATE_TOML = [
+  'exclude = [\n',
+  '  ".venv",\n',
+  '  "new",\n',
+  '  "*.py[co]",\n',
+  ']\n',
+  '\n',
+  '[lint]\n',
+  'select = ["E", "F"]\n',
+]
+
+
+def toLines(text: str) -> list[str]:
+  return text.splitlines(keepends=True)
+
+
+def parseLines(linesList: list[str]) -> dict:
+  return tomllib.loads(''.join(linesList))
+
+
+class MergeLineSetsTests(unittest.TestCase):
+  def test_appends_missing_entries_under_marker(self):
+    existingLines = toLines('# mine\n.venv\nbuild/\n')
+    mergedLines = bootstrap.mergeLineSets(existingLines, toLines('.venv\n# comment\ndist/\n\n*.pyc\n'))
+
+    self.assertEqual(mergedLines, existingLines + ['\n', MARKER_LINE, 'dist/\n', '*.pyc\n'])
+
+  def test_existing_marker_block_is_extended(self):
+    existingLines = ['.venv\n', '\n', MARKER_LINE, 'dist/\n', '\n', '# mine\n', 'local/\n']
+    mergedLines = bootstrap.mergeLineSets(existingLines, toLines('dist/\ncoverage/\n'))
+
+    self.assertEqual(mergedLines, existingLines[:4] + ['coverage/\n'] + existingLines[4:])
+    self.assertEqual(bootstrap.mergeLineSets(mergedLines, toLines('dist/\ncoverage/\n')), mergedLines)
+
+
+class MergeTomlArraysTests(unittest.TestCase):
+  def assertMerged(self, existingText: str, expectedMap: dict[str, list[str]]) -> list[str]:
+    mergedLines = bootstrap.mergeTomlArrays(toLines(existingText), TEMPLATE_TOML)
+    dataObj = parseLines(mergedLines)
+
+    for keyText, expectedItems in expectedMap.items():
+      valueObj = dataObj
+      for partText in keyText.split('.'):
+        valueObj = valueObj[partText]
+      self.assertEqual(valueObj, expectedItems, keyText)
+
+    self.assertEqual(bootstrap.mergeTomlArrays(mergedLines, TEMPLATE_TOML), mergedLines)
+
+    return mergedLines
+
+  def test_multiline_array_with_brackets_inside_items(self):
+    mergedLines = self.assertMerged(
+      'exclude = [\n  "mydir",\n  "*.py[co]",  # compiled [x]\n  ".venv"\n]\n',
+      {'exclude': ['mydir', '*.py[co]', '.venv', 'new']},
+    )
+
+    self.assertEqual(mergedLines[-3:], [f'  {MARKER_LINE}', '  "new",\n', ']\n'])
+
+  def test_single_line_array_with_bracket_comment(self):
+    mergedLines = self.assertMerged(
+      '[lint]\nselect = ["E"]  # comment [x]\n', {'lint.select': ['E', 'F']}
+    )
+
+    self.assertEqual(mergedLines[1], 'select = ["E", "F"]  # comment [x]\n')
+
+  def test_closing_bracket_after_last_item(self):
+    self.assertMerged(
+      'exclude = ["mydir",\n  ".venv"]\n', {'exclude': ['mydir', '.venv', 'new', '*.py[co]']}
+    )
+
+  def test_empty_and_trailing_comma_arrays(self):
+    self.assertMerged('exclude = []\n', {'exclude': ['.venv', 'new', '*.py[co]']})
+    self.assertMerged('exclude = ["a",]\n', {'exclude': ['a', '.venv', 'new', '*.py[co]']})
+    self.assertMerged('exclude = [\n]\n', {'exclude': ['.venv', 'new', '*.py[co]']})
+
+  def test_hash_and_escapes_inside_strings(self):
+    self.assertMerged(
+      'exclude = [\n  "a#b",\n  \'c]\',\n  "d\\"]"\n]\n',
+      {'exclude': ['a#b', 'c]', 'd"]', '.venv', 'new', '*.py[co]']},
+    )
+
+  def test_arrays_missing_from_existing_file_are_not_added(self):
+    existingLines = toLines('line-length = 100\n')
+
+    self.assertEqual(bootstrap.mergeTomlArrays(existingLines, TEMPLATE_TOML), existingLines)
+
+  def test_invalid_existing_file_raises(self):
+    with self.assertRaises(ValueError):
+      bootstrap.mergeTomlArrays(toLines('exclude = [\n  "x"\n'), TEMPLATE_TOML)
+
+
+class RunTaskGraphTests(unittest.TestCase):
+  def test_no_new_tasks_start_after_a_failure(self):
+    startedList: list[str] = []
+
+    def failSoon() -> None:
+      time.sleep(0.05)
+      raise OSError('boom')
+
+    def record(nameText: str) -> None:
+      startedList.append(nameText)
+
+    taskGraph = {
+      'fail': (failSoon, ()),
+      'slow': (lambda: time.sleep(0.2) or record('slow'), ()),
+      'after': (lambda _slowResult: record('after'), ('slow',)),
+    }
+    completedList: list[str] = []
+
+    with self.assertRaises(OSError):
+      bootstrap.runTaskGraph(taskGraph, 2, onComplete=lambda nameText, _: completedList.append(nameText))
+
+    self.assertEqual(startedList, ['slow'])
+    self.assertEqual(completedList, ['slow'])
+
+  def test_results_are_passed_to_dependents(self):
+    taskGraph = {
+      'a': (lambda: 2, ()),
+      'b': (lambda: 3, ()),
+      'sum': (lambda aValue, bValue: aValue + bValue, ('a', 'b')),
+    }
+
+    self.assertEqual(bootstrap.runTaskGraph(taskGraph, 4)['sum'], 5)
+
+  def test_user_name_is_looked_up_once_across_tasks(self):
+    callsList: list[int] = []
+
+    def slowGitName() -> str:
+      callsList.append(1)
+      time.sleep(0.05)
+      return 'Jane Doe'
+
+    bootstrap.lookupUserName.cache_clear()
+    self.addCleanup(bootstrap.lookupUserName.cache_clear)
+    taskGraph = {f'parse:{index}': (bootstrap.getUserName, ()) for index in range(4)}
+
+    with mock.patch.object(bootstrap, 'getUserNameFromGit', slowGitName):
+      resultsMap = bootstrap.runTaskGraph(taskGraph, 4)
+
+    self.assertEqual(set(resultsMap.values()), {'Jane Doe'})
+    self.assertEqual(len(callsList), 1)
+
+
+class PlanTemplateTests(unittest.TestCase):
+  def setUp(self):
+    self.tempDir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.tempDir.cleanup)
+    self.projectPath = Path(self.tempDir.name)
+    self.outputPath = self.projectPath / 'config.txt'
+
+  def plan(self, sourceText: str, force: bool = True, diffLimit: int = 200) -> bootstrap.PlanEntryType:
+    _, planEntry = bootstrap.planTemplate(
+      self.outputPath, force, diffLimit, None, (toLines(sourceText), 'embedded config')
+    )
+    return planEntry
+
+  def test_new_file(self):
+    planEntry = self.plan('a\nb\n')
+
+    self.assertEqual((planEntry['status'], planEntry['bytes'], planEntry['linesAdded']), ('new', 4, 2))
+    self.assertIn('[PLAN] new', bootstrap.formatPlanEntry(planEntry))
+    self.assertIn('(4 bytes, 2 lines) from embedded config', bootstrap.formatPlanEntry(planEntry))
+    self.assertFalse(self.outputPath.exists())
+
+  def test_unchanged_and_skipped_files(self):
+    self.outputPath.write_text('a\nb\n', encoding='utf-8')
+
+    self.assertEqual(self.plan('a\nb\n')['status'], 'unchanged')
+
+    planEntry = self.plan('c\n', force=False)
+    self.assertEqual((planEntry['status'], planEntry['diff']), ('skipped', []))
+    self.assertIn('(exists, not forced)', bootstrap.formatPlanEntry(planEntry))
+    self.assertEqual(self.outputPath.read_text(encoding='utf-8'), 'a\nb\n')
+
+  def test_modified_file_is_diffed(self):
+    self.outputPath.write_text('a\nb\nc\n', encoding='utf-8')
+    planEntry = self.plan('a\nB\nc\nd\n')
+
+    self.assertEqual(planEntry['status'], 'modified')
+    self.assertEqual(
+      (planEntry['linesAdded'], planEntry['linesRemoved'], planEntry['bytesChanged']), (2, 1, 6)
+    )
+    self.assertIn('+B\n', planEntry['diff'])
+    self.assertFalse(planEntry['diffTruncated'])
+    self.assertIn('(+2 -1 lines, 6 bytes changed)', bootstrap.formatPlanEntry(planEntry))
+
+  def test_diff_is_cut_at_the_limit(self):
+    self.outputPath.write_text(''.join(f'old {index}\n' for index in range(50)), encoding='utf-8')
+    planEntry = self.plan(''.join(f'new {index}\n' for index in range(50)), diffLimit=10)
+
+    self.assertEqual(len(planEntry['diff']), 10)
+    self.assertTrue(planEntry['diffTruncated'])
+    self.assertEqual((planEntry['linesAdded'], planEntry['linesRemoved']), (50, 50))
+    self.assertTrue(bootstrap.formatPlanEntry(planEntry).endswith('  ... diff truncated'))
+
+  def test_large_file_is_compared_by_digest_only(self):
+    existingBytes = bootstrap.PLAN_MAX_DIFF_BYTES + 100
+    self.outputPath.write_bytes(b'x' * (existingBytes - 1) + b'\n')
+    planEntry = self.plan('small\n')
+
+    self.assertEqual(planEntry['status'], 'modified')
+    self.assertIsNone(planEntry['linesAdded'])
+    self.assertEqual(planEntry['diff'], [])
+    self.assertEqual(planEntry['bytesChanged'], existingBytes - 6)
+    self.assertIn(
+      f'(~{existingBytes - 6} bytes changed, too large to diff)', bootstrap.formatPlanEntry(planEntry)
+    )
+
+  def test_plan_json_describes_files_without_writing_them(self):
+    (self.projectPath / 'pyproject.toml').write_text('[project]\nname = "demo"\n', encoding='utf-8')
+    (self.projectPath / '.python-version').write_text('3.12\n', encoding='utf-8')
+    namesBefore = sorted(os.listdir(self.projectPath))
+    outputBuffer = io.StringIO()
+
+    previousDir = os.getcwd()
+    os.chdir(self.projectPath)
+    self.addCleanup(os.chdir, previousDir)
+
+    with (
+      mock.patch.object(bootstrap, 'getUserName', lambda: 'Jane Doe'),
+      contextlib.redirect_stdout(outputBuffer),
+      contextlib.redirect_stderr(io.StringIO()),
+    ):
+      self.assertEqual(bootstrap.main(['--plan-json', '-', '--jobs', '2']), 0)
+
+    planObj = json.loads(outputBuffer.getvalue())
+    statusByName = {Path(entryObj['path']).name: entryObj['status'] for entryObj in planObj['files']}
+
+    self.assertEqual(planObj['project'], str(self.projectPath))
+    self.assertEqual(statusByName['main.py'], 'new')
+    self.assertLessEqual(set(statusByName.values()), {'new', 'unchanged', 'modified', 'skipped'})
+    self.assertEqual(sorted(os.listdir(self.projectPath)), namesBefore)
+
+
+if __name__ == '__main__':
+  unittest.main()
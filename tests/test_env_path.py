@@ -0,0 +1,279 @@
+"""
+ Program: Tests for Print-Environment-Path
+    Name: Andrew Dixon            File: test_env_path.py
+    Date: 19 Oct 2026
+   Notes: Every directory used is created under a temporary root.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+import contextlib
+from unittest import mock
+
+from useful_scripts import env_path
+
+
+def touch(pathText: str, executable: bool = False) -> None:
+  os.makedirs(os.path.dirname(pathText), exist_ok=True)
+  with open(pathText, 'w', encoding='utf-8'):
+    pass
+
+  if executable:
+    os.chmod(pathText, 0o755)
+
+
+def resolveAll(pathEntries: list[str], namesByPath: dict[str, set[str]]) -> dict[str, str]:
+  # Which entry each name resolves to, searching the entries in order.
+  resolvedMap: dict[str, str] = {}
+  for dirPath in pathEntries:
+    for nameText in namesByPath.get(dirPath, ()):
+      resolvedMap.setdefault(nameText, dirPath)
+
+  return resolvedMap
+
+
+class TempDirTestCase(unittest.TestCase):
+  def setUp(self):
+    self.tempDir = tempfile.TemporaryDirectory()
+    self.rootPath = self.tempDir.name
+
+  def tearDown(self):
+    self.tempDir.cleanup()
+
+
+class ExtractVariableTests(unittest.TestCase):
+  def test_first_middle_last_and_missing(self):
+    environBlob = b'PATH=/a:/b\0MYPATH=/x\0HOME=/root\0LAST=1'
+
+    self.assertEqual(env_path.extractVariable(environBlob, b'PATH='), b'/a:/b')
+    self.assertEqual(env_path.extractVariable(environBlob, b'MYPATH='), b'/x')
+    self.assertEqual(env_path.extractVariable(environBlob, b'LAST='), b'1')
+    self.assertIsNone(env_path.extractVariable(environBlob, b'ATH='))
+    self.assertIsNone(env_path.extractVariable(b'', b'PATH='))
+
+  def test_empty_value_is_not_missing(self):
+    self.assertEqual(env_path.extractVariable(b'A=1\0PATH=\0B=2', b'PATH='), b'')
+
+
+class ScanProcessVariableTests(TempDirTestCase):
+  def addProcess(self, pid: int, environBlob: bytes | None, commandName: str = '') -> None:
+    processDir = os.path.join(self.rootPath, str(pid))
+    os.makedirs(processDir)
+
+    if environBlob is not None:
+      with open(os.path.join(processDir, 'environ'), 'wb') as environFile:
+        environFile.write(environBlob)
+
+    if commandName:
+      with open(os.path.join(processDir, 'comm'), 'w', encoding='utf-8') as commFile:
+        commFile.write(commandName + '\n')
+
+  def test_groups_processes_by_value(self):
+    self.addProcess(10, b'HOME=/root\0PATH=/usr/bin:/bin\0', 'bash')
+    self.addProcess(11, b'PATH=/usr/bin:/bin\0', 'bash')
+    self.addProcess(12, b'PATH=/opt/bin\0', 'cron')
+    self.addProcess(13, b'HOME=/root\0', 'sleep')
+    self.addProcess(14, None)                            # exited before environ was read
+    os.makedirs(os.path.join(self.rootPath, 'self'))     # not a process
+
+    resultObj = env_path.scanProcessVariable(self.rootPath, 'PATH', jobs=4)
+
+    self.assertEqual(resultObj['total'], 5)
+    self.assertEqual(resultObj['counts']['ok'], 3)
+    self.assertEqual(resultObj['counts']['unset'], 1)
+    self.assertEqual(resultObj['counts']['exited'], 1)
+
+    variantsMap = resultObj['variants']
+    self.assertEqual(sorted(variantsMap[b'/usr/bin:/bin']['pids']), [10, 11])
+    self.assertEqual(variantsMap[b'/usr/bin:/bin']['commands'], {'bash': 2})
+    self.assertEqual(variantsMap[b'/opt/bin']['pids'], [12])
+
+  def test_missing_procfs_exits(self):
+    with self.assertRaises(SystemExit):
+      env_path.scanProcessVariable(os.path.join(self.rootPath, 'nope'), 'PATH', jobs=1)
+
+
+class ReorderTests(TempDirTestCase):
+  def makePath(self, layoutMap: dict[str, list[str]]) -> list[str]:
+    pathEntries: list[str] = []
+    for dirName, commandNames in layoutMap.items():
+      dirPath = os.path.join(self.rootPath, dirName)
+      os.makedirs(dirPath, exist_ok=True)
+      for commandName in commandNames:
+        touch(os.path.join(dirPath, commandName), executable=True)
+      pathEntries.append(dirPath)
+
+    return pathEntries
+
+  def optimize(self, pathEntries: list[str], hotCommands: list[str] = ()) -> list[str]:
+    listingsList = env_path.scanDirectories(pathEntries, {}, 'executables', env_path.listExecutables, 4)
+    executableIndex = env_path.buildExecutableIndex(listingsList)
+    indexedPaths = {listingObj['path'] for listingObj in listingsList if listingObj['mtime'] is not None}
+    entriesList = env_path.analyzePathEntries(pathEntries, executableIndex, list(hotCommands), indexedPaths)
+
+    return env_path.optimizePathEntries(entriesList, executableIndex)
+
+  def assertSameResolution(self, pathEntries: list[str], optimizedEntries: list[str]) -> None:
+    namesByPath = {dirPath: set(env_path.listExecutables(dirPath)) for dirPath in set(pathEntries)}
+    self.assertEqual(resolveAll(pathEntries, namesByPath), resolveAll(optimizedEntries, namesByPath))
+
+  def test_busy_directory_moves_forward_without_changing_resolution(self):
+    pathEntries = self.makePath({
+      'small': ['python', 'tool'],
+      'shadowed': ['tool'],
+      'big': ['python', 'ls', 'cat', 'grep', 'sed'],
+      'other': ['make'],
+    })
+
+    optimizedEntries = self.optimize(pathEntries)
+
+    self.assertSameResolution(pathEntries, optimizedEntries)
+    self.assertNotIn(pathEntries[1], optimizedEntries)          # never the first hit
+    self.assertLess(optimizedEntries.index(pathEntries[2]), optimizedEntries.index(pathEntries[3]))
+    self.assertLess(optimizedEntries.index(pathEntries[0]), optimizedEntries.index(pathEntries[2]))
+
+  def test_hot_commands_come_first(self):
+    pathEntries = self.makePath({'a': ['x', 'y', 'z'], 'b': ['hot']})
+
+    optimizedEntries = self.optimize(pathEntries, ['hot'])
+
+    self.assertEqual(optimizedEntries, [pathEntries[1], pathEntries[0]])
+    self.assertSameResolution(pathEntries, optimizedEntries)
+
+  def test_reorder_segment_respects_shadowing(self):
+    executableIndex = {'tool': ['/a', '/b'], 'ls': ['/b'], 'cat': ['/b']}
+    segmentList = [
+      {'path': '/a', 'index': 0, 'hot': 0, 'wins': 1},
+      {'path': '/b', 'index': 1, 'hot': 0, 'wins': 2},
+    ]
+
+    self.assertEqual(env_path.reorderSegment(segmentList, executableIndex), ['/a', '/b'])
+
+  def test_unlistable_entry_is_kept_in_place(self):
+    pathEntries = self.makePath({'a': ['x'], 'b': ['y', 'z']})
+    brokenPath = os.path.join(self.rootPath, 'broken')
+    os.makedirs(brokenPath)
+    pathEntries.insert(1, brokenPath)
+
+    listingsList = env_path.scanDirectories(pathEntries, {}, 'executables', env_path.listExecutables, 1)
+    listingsList[1]['mtime'] = None                           # as if scandir had failed
+    executableIndex = env_path.buildExecutableIndex(listingsList)
+    indexedPaths = {listingObj['path'] for listingObj in listingsList if listingObj['mtime'] is not None}
+    entriesList = env_path.analyzePathEntries(pathEntries, executableIndex, [], indexedPaths)
+
+    self.assertEqual(env_path.optimizePathEntries(entriesList, executableIndex), pathEntries)
+
+
+class OptimizeCacheTests(TempDirTestCase):
+  def runMain(self, argsList: list[str], pathEntries: list[str]) -> str:
+    environMap = {
+      'PATH': os.pathsep.join(pathEntries), 'XDG_CACHE_HOME': os.path.join(self.rootPath, 'cache'),
+    }
+    outputBuffer = io.StringIO()
+
+    with mock.patch.dict(os.environ, environMap), contextlib.redirect_stdout(outputBuffer):
+      env_path.main(argsList)
+
+    return outputBuffer.getvalue()
+
+  def test_optimize_sees_chmod_that_the_cache_missed(self):
+    firstPath = os.path.join(self.rootPath, 'a')
+    secondPath = os.path.join(self.rootPath, 'b')
+    touch(os.path.join(firstPath, 'tool'))
+    touch(os.path.join(secondPath, 'tool'), executable=True)
+
+    pathEntries = [firstPath, secondPath]
+    self.assertIn(os.path.join(secondPath, 'tool'), self.runMain(['--which', 'tool'], pathEntries))
+
+    # chmod leaves the directory mtime alone, so the cached listing of 'a' is now stale.
+    os.chmod(os.path.join(firstPath, 'tool'), 0o755)
+    outputText = self.runMain(['--optimize', '--sample', '1'], pathEntries)
+
+    self.assertIn(f"export PATH='{firstPath}'", outputText)
+    self.assertIn(f'{os.path.join(firstPath, "tool")}\n  shadows', self.runMain(['--shadowed'], pathEntries))
+
+
+class ModuleListingTests(TempDirTestCase):
+  def test_kinds_are_ranked_regardless_of_listing_order(self):
+    touch(os.path.join(self.rootPath, 'foo.py'))
+    os.makedirs(os.path.join(self.rootPath, 'foo'))
+    touch(os.path.join(self.rootPath, 'pkg.py'))
+    touch(os.path.join(self.rootPath, 'pkg', '__init__.py'))
+    os.makedirs(os.path.join(self.rootPath, 'ns'))
+    os.makedirs(os.path.join(self.rootPath, '__pycache__'))
+
+    self.assertEqual(
+      env_path.listModules(self.rootPath),
+      [['foo', 'module'], ['ns', 'namespace'], ['pkg', 'package']],
+    )
+
+
+class ManPageTests(TempDirTestCase):
+  def test_pages_are_indexed_by_section(self):
+    touch(os.path.join(self.rootPath, 'man1', 'ls.1.gz'))
+    touch(os.path.join(self.rootPath, 'man5', 'passwd.5'))
+    touch(os.path.join(self.rootPath, 'cat1', 'ls.1'))
+    touch(os.path.join(self.rootPath, 'README'))
+
+    self.assertEqual(env_path.listManPages(self.rootPath), ['man1/ls.1', 'man5/passwd.5'])
+
+  def test_optimize_keeps_man_directories(self):
+    firstPath = os.path.join(self.rootPath, 'first')
+    secondPath = os.path.join(self.rootPath, 'second')
+    touch(os.path.join(firstPath, 'man1', 'foo.1'))
+    touch(os.path.join(secondPath, 'man1', 'bar.1'))
+
+    listingsList = env_path.scanDirectories(
+      [firstPath, secondPath], {}, 'manpages', env_path.listManPages, 2, env_path.manTreeMtime
+    )
+    executableIndex = env_path.buildExecutableIndex(listingsList)
+    entriesList = env_path.analyzePathEntries([firstPath, secondPath], executableIndex, [])
+
+    self.assertEqual([entryObj['problem'] for entryObj in entriesList], ['', ''])
+    self.assertEqual(
+      sorted(env_path.optimizePathEntries(entriesList, executableIndex)), [firstPath, secondPath]
+    )
+
+  def test_empty_manpath_entries_are_kept_as_barriers(self):
+    firstPath = os.path.join(self.rootPath, 'first')
+    secondPath = os.path.join(self.rootPath, 'second')
+    touch(os.path.join(firstPath, 'man1', 'foo.1'))
+    touch(os.path.join(secondPath, 'man1', 'foo.1'))
+    touch(os.path.join(secondPath, 'man1', 'bar.1'))
+    touch(os.path.join(secondPath, 'man1', 'baz.1'))
+
+    manPath = os.pathsep.join(['', firstPath, '', secondPath, ''])
+    pathEntries = env_path.splitPathList(manPath, '')
+    listingsList = env_path.scanDirectories(
+      [firstPath, secondPath], {}, 'manpages', env_path.listManPages, 2, env_path.manTreeMtime
+    )
+    executableIndex = env_path.buildExecutableIndex(listingsList)
+    entriesList = env_path.analyzePathEntries(
+      pathEntries, executableIndex, ['bar.1'], {firstPath, secondPath}
+    )
+
+    self.assertEqual(pathEntries, ['', firstPath, '', secondPath, ''])
+    self.assertEqual(env_path.optimizePathEntries(entriesList, executableIndex), pathEntries)
+
+  def test_optimize_prints_empty_manpath_entries_back(self):
+    firstPath = os.path.join(self.rootPath, 'first')
+    touch(os.path.join(firstPath, 'man1', 'foo.1'))
+    environMap = {'MANPATH': firstPath + os.pathsep, 'XDG_CACHE_HOME': os.path.join(self.rootPath, 'cache')}
+    outputBuffer = io.StringIO()
+
+    with mock.patch.dict(os.environ, environMap), contextlib.redirect_stdout(outputBuffer):
+      env_path.main(['--var', 'MANPATH', '--optimize'])
+
+    self.assertIn(f"export MANPATH='{firstPath}{os.pathsep}'", outputBuffer.getvalue())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,367 @@
+"""
+ Program: Tests for the Wake-on-LAN host cache
+    Name: Andrew Dixon            File: test_wol.py
+    Date: 19 Oct 2026
+   Notes: Routing and sending, neighbor table and lease parsers, incremental lease reads,
+          host lookup, and wake plan checks and scheduling.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
+
+import io
+import os
+import json
+import datetime
+import ipaddress
+import tempfile
+import unittest
+import contextlib
+
+from useful_scripts import wol
+
+ARP_TABLE = b'''IP address       HW type     Flags       HW address            Mask     Device
+192.0.2.10       0x1         0x2         de:ad:be:ef:00:01     *        eth0
+192.0.2.11       0x1         0x0         00:00:00:00:00:00     *        eth0
+10.9.9.9         0x1         0x2         de:ad:be:ef:00:09     *        eth1
+bogus line
+'''
+
+IP_NEIGH = b'''192.0.2.12 dev eth0 lladdr de:ad:be:ef:00:02 STALE
+192.0.2.13 dev eth0 FAILED
+192.0.2.14 dev eth0 lladdr de:ad:be:ef:00:04 router REACHABLE
+fe80::1 dev eth0 lladdr de:ad:be:ef:00:03 router REACHABLE
+'''
+
+ISC_HEADER = b'''# The format of this file is documented in the dhcpd.leases(5) manual page.
+authoring-byte-order little-endian;
+
+'''
+
+ISC_LEASE_NAS = b'''lease 192.0.2.10 {
+  starts 4 2026/10/15 10:00:00;
+  cltt 4 2026/10/15 11:00:00;
+  binding state active;
+  hardware ethernet de:ad:be:ef:00:01;
+  client-hostname "nas1";
+}
+'''
+
+ISC_LEASE_OLD = b'''lease 192.0.2.20 {
+  starts epoch 1760522400; # Wed Oct 15 10:00:00 2025
+  binding state free;
+  hardware ethernet de:ad:be:ef:00:20;
+}
+'''
+
+ISC_PARTIAL = b'''lease 192.0.2.31 {
+  hardware ethernet de:ad'''
+
+INTERFACES = [{
+  'name': 'eth0', 'address': '192.0.2.2',
+  'network': ipaddress.IPv4Network('192.0.2.0/24'), 'broadcast': '192.0.2.255',
+}]
+
+
+class FakeSocket:
+  def __init__(self, failing: set[str] = frozenset()):
+    self.failing = failing
+    self.sent: list[tuple[bytes, tuple[str, int]]] = []
+
+  def sendto(self, packet: bytes, address: tuple[str, int]) -> None:
+    if address[0] in self.failing:
+      raise OSError('Network is unreachable')
+
+    self.sent.append((packet, address))
+
+  def close(self) -> None:
+    pass
+
+
+class RouteTests(unittest.TestCase):
+  def test_targets_follow_the_interface_on_their_subnet(self):
+    local = wol.parse_target('de:ad:be:ef:00:01@192.0.2.0/25')
+    remote = wol.parse_target('de:ad:be:ef:00:02@10.20.0.0/16')
+    plain = wol.parse_target('de:ad:be:ef:00:03', '192.0.2.255')
+
+    routes = wol.route_targets([local, remote, plain], INTERFACES)
+
+    self.assertEqual(
+      [(iface and iface['name'], [target['mac'] for target in routed]) for iface, routed in routes],
+      [('eth0', ['de:ad:be:ef:00:01']), (None, ['de:ad:be:ef:00:02', 'de:ad:be:ef:00:03'])],
+    )
+    self.assertEqual(
+      [local['broadcast'], remote['broadcast'], plain['broadcast']],
+      ['192.0.2.127', '10.20.255.255', '192.0.2.255'],
+    )
+
+  def test_send_routes_uses_each_interface_socket(self):
+    targets = [
+      wol.parse_target('de:ad:be:ef:00:01@192.0.2.0/24'),
+      wol.parse_target('de:ad:be:ef:00:02@10.20.0.0/16'),
+      wol.parse_target('de:ad:be:ef:00:03@10.30.0.0/16'),
+    ]
+    wol.build_packets(targets)
+    sockets = {'eth0': FakeSocket(), None: FakeSocket(failing={'10.30.255.255'})}
+
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+      sent = wol.send_routes(wol.route_targets(targets, INTERFACES), sockets=sockets)
+
+    self.assertEqual(sent, 2)
+    self.assertEqual(
+      sockets['eth0'].sent, [(wol.build_packet('de:ad:be:ef:00:01'), ('192.0.2.255', wol.WOL_PORT))]
+    )
+    self.assertEqual([address for _, address in sockets[None].sent], [('10.20.255.255', wol.WOL_PORT)])
+    self.assertIn('Failed to wake de:ad:be:ef:00:03', output.getvalue())
+
+  def test_malformed_subnet_is_a_usage_error(self):
+    with contextlib.redirect_stderr(io.StringIO()) as output, self.assertRaises(SystemExit) as caught:
+      wol.main(['de:ad:be:ef:00:01@10.0.0.0/33'])
+
+    self.assertEqual(caught.exception.code, 2)
+    self.assertIn("invalid target 'de:ad:be:ef:00:01@10.0.0.0/33'", output.getvalue())
+
+
+class ParserTests(unittest.TestCase):
+  def test_arp_table_keeps_complete_entries(self):
+    neighbors = wol.parse_arp_table(ARP_TABLE, 5.0)
+
+    self.assertEqual(
+      [(neighbor['ip'], neighbor['mac']) for neighbor in neighbors],
+      [('192.0.2.10', 'de:ad:be:ef:00:01'), ('10.9.9.9', 'de:ad:be:ef:00:09')],
+    )
+    self.assertTrue(all(neighbor['seen'] == 5.0 for neighbor in neighbors))
+
+  def test_ip_neigh_skips_failed_and_ipv6(self):
+    neighbors = wol.parse_ip_neigh(IP_NEIGH, 5.0)
+
+    self.assertEqual(
+      [(neighbor['ip'], neighbor['mac']) for neighbor in neighbors],
+      [('192.0.2.12', 'de:ad:be:ef:00:02'), ('192.0.2.14', 'de:ad:be:ef:00:04')],
+    )
+
+  def test_isc_leases_stop_before_partial_block(self):
+    data = ISC_HEADER + ISC_LEASE_NAS + ISC_LEASE_OLD + ISC_PARTIAL
+    neighbors, consumed = wol.parse_isc_leases(data, 5.0)
+
+    self.assertEqual([neighbor['ip'] for neighbor in neighbors], ['192.0.2.10', '192.0.2.20'])
+    self.assertEqual(consumed, len(ISC_HEADER + ISC_LEASE_NAS + ISC_LEASE_OLD))
+    self.assertEqual(neighbors[0]['hostname'], 'nas1')
+    # cltt (11:00) wins over starts (10:00); lease times are UTC.
+    cltt = datetime.datetime(2026, 10, 15, 11, 0, tzinfo=datetime.UTC).timestamp()
+    self.assertEqual(neighbors[0]['seen'], cltt)
+    self.assertIsNone(neighbors[1]['hostname'])
+    self.assertEqual(neighbors[1]['seen'], 1760522400.0)
+
+  def test_dnsmasq_leases(self):
+    data = (
+      b'1760608800 de:ad:be:ef:00:02 192.0.2.12 hv1 01:de:ad:be:ef:00:02\n'
+      b'1760608800 de:ad:be:ef:00:04 192.0.2.14 * *\n'
+      b'duid 00:01:00:01:2c:aa:bb:cc:de:ad:be:ef:00:05\n'
+    )
+    neighbors = wol.parse_dnsmasq_leases(data, 5.0)
+
+    self.assertEqual([neighbor['hostname'] for neighbor in neighbors], ['hv1', None])
+
+
+class RefreshTests(unittest.TestCase):
+  def setUp(self):
+    self.temp_dir = tempfile.TemporaryDirectory()
+    self.lease_path = os.path.join(self.temp_dir.name, 'dhcpd.leases')
+
+  def tearDown(self):
+    self.temp_dir.cleanup()
+
+  def refresh(self, cache: wol.NeighborCacheType) -> dict[str, int]:
+    return wol.refresh_neighbors(
+      cache, INTERFACES, arp_files=[], neigh_files=[], lease_files=[self.lease_path],
+      live_neigh=False,
+    )
+
+  def test_isc_leases_are_read_incrementally(self):
+    with open(self.lease_path, 'wb') as lease_file:
+      lease_file.write(ISC_HEADER + ISC_LEASE_NAS + ISC_PARTIAL)
+
+    cache = wol.new_neighbor_cache()
+    counts = self.refresh(cache)
+    first_offset = cache['sources'][self.lease_path]['offset']
+
+    self.assertEqual((counts['read'], counts['added']), (1, 1))
+    self.assertEqual(first_offset, len(ISC_HEADER + ISC_LEASE_NAS))
+    self.assertEqual(cache['hosts']['de:ad:be:ef:00:01']['subnet'], '192.0.2.0/24')
+
+    counts = self.refresh(cache)
+    self.assertEqual(counts['unchanged'], 1)
+
+    # Finishing the partial block makes it readable; earlier leases are not parsed again.
+    with open(self.lease_path, 'ab') as lease_file:
+      lease_file.write(b':be:ef:00:31;\n}\n')
+
+    counts = self.refresh(cache)
+
+    self.assertEqual((counts['entries'], counts['added']), (1, 1))
+    self.assertIn('de:ad:be:ef:00:31', cache['hosts'])
+    self.assertEqual(cache['sources'][self.lease_path]['offset'], os.path.getsize(self.lease_path))
+
+  def test_replaced_lease_file_is_read_from_the_start(self):
+    with open(self.lease_path, 'wb') as lease_file:
+      lease_file.write(ISC_HEADER + ISC_LEASE_NAS + ISC_LEASE_OLD)
+
+    cache = wol.new_neighbor_cache()
+    self.refresh(cache)
+
+    replacement_path = self.lease_path + '.new'
+    with open(replacement_path, 'wb') as lease_file:
+      lease_file.write(ISC_HEADER + ISC_LEASE_NAS)
+    os.replace(replacement_path, self.lease_path)
+
+    counts = self.refresh(cache)
+
+    self.assertEqual(counts['entries'], 1)
+    self.assertEqual(cache['sources'][self.lease_path]['offset'], len(ISC_HEADER + ISC_LEASE_NAS))
+
+
+class LookupTests(unittest.TestCase):
+  def setUp(self):
+    self.cache = wol.new_neighbor_cache()
+    self.cache['hosts'] = {
+      'de:ad:be:ef:00:0a': {'ip': '10.0.0.1', 'hostname': 'web.a.example', 'subnet': None, 'lastSeen': 100},
+      'de:ad:be:ef:00:0b': {'ip': '10.0.0.2', 'hostname': 'web.b.example', 'subnet': None, 'lastSeen': 200},
+      'de:ad:be:ef:00:0c': {'ip': '10.0.0.3', 'hostname': 'hv1', 'subnet': None, 'lastSeen': 50},
+      'de:ad:be:ef:00:0d': {'ip': '10.0.0.3', 'hostname': None, 'subnet': None, 'lastSeen': 60},
+    }
+
+  def lookup_mac(self, name: str) -> str | None:
+    record = wol.lookup_host(self.cache, name)
+    return record and record['mac']
+
+  def test_exact_hostname_wins_over_newer_first_label_match(self):
+    self.assertEqual(self.lookup_mac('web.a.example'), 'de:ad:be:ef:00:0a')
+    self.assertEqual(self.lookup_mac('WEB.B.example'), 'de:ad:be:ef:00:0b')
+
+  def test_first_label_fallback(self):
+    self.assertEqual(self.lookup_mac('web'), 'de:ad:be:ef:00:0b')
+    self.assertEqual(self.lookup_mac('hv1.lan'), 'de:ad:be:ef:00:0c')
+    self.assertIsNone(self.lookup_mac('web.c.example'))
+
+  def test_ip_lookup_takes_most_recent(self):
+    self.assertEqual(self.lookup_mac('10.0.0.3'), 'de:ad:be:ef:00:0d')
+    self.assertIsNone(self.lookup_mac('10.0.0.9'))
+
+
+class PlanTests(unittest.TestCase):
+  def setUp(self):
+    self.tempDir = tempfile.TemporaryDirectory()
+    self.planPath = os.path.join(self.tempDir.name, 'plan.json')
+
+  def tearDown(self):
+    self.tempDir.cleanup()
+
+  def load(self, hosts: list[dict], stages: list[dict]) -> wol.PlanType:
+    with open(self.planPath, 'w', encoding='utf-8') as planFile:
+      json.dump({'hosts': hosts, 'stages': stages}, planFile)
+
+    return wol.load_plan(self.planPath)
+
+  def assertPlanError(self, hosts: list[dict], stages: list[dict], text: str) -> None:
+    with self.assertRaises(SystemExit) as caught:
+      self.load(hosts, stages)
+
+    self.assertIn(text, str(caught.exception))
+
+  def test_targets_are_built_up_front(self):
+    plan = self.load(
+      [{'name': 'nas1', 'mac': 'DE-AD-BE-EF-00-01', 'subnet': '10.0.10.0/24', 'groups': ['storage']}],
+      [{'select': ['storage']}],
+    )
+
+    host = plan['stages'][0]['hosts'][0]
+    self.assertEqual(host['mac'], 'de:ad:be:ef:00:01')
+    self.assertEqual(host['target']['broadcast'], '10.0.10.255')
+
+  def test_bad_hosts_stop_the_plan(self):
+    self.assertPlanError([{'name': 'nas1'}], [{}], "host 'nas1' has no \"mac\"")
+    self.assertPlanError([{'name': 'nas1', 'mac': 'de:ad:be:ef:00'}], [{}], 'Not a MAC address')
+    self.assertPlanError([{'mac': 'de:ad:be:ef:00:zz'}], [{}], "host '#1': Not a MAC address")
+    self.assertPlanError(
+      [{'name': 'nas1', 'mac': 'de:ad:be:ef:00:01', 'subnet': '10.0.10.0/33'}], [{}], 'netmask'
+    )
+
+  def test_unknown_selector_is_rejected(self):
+    self.assertPlanError(
+      [{'name': 'nas1', 'mac': 'de:ad:be:ef:00:01', 'groups': ['storage']}],
+      [{'name': 'first', 'select': ['storage', 'stroage']}],
+      "Stage 'first' selects names that match no host or group: stroage",
+    )
+
+
+class ScheduleTests(unittest.TestCase):
+  def test_actions_run_in_due_order_on_the_given_clock(self):
+    now = [0.0]
+    sleeps: list[float] = []
+    ran: list[tuple[str, float]] = []
+
+    def sleep(delay: float) -> None:
+      sleeps.append(delay)
+      now[0] += delay
+
+    queue: wol.EventQueueType = []
+    wol.schedule(queue, 5.0, lambda: ran.append(('late', now[0])))
+    wol.schedule(queue, 1.0, lambda: ran.append(('early', now[0])))
+    wol.schedule(queue, 1.0, lambda: ran.append(('early, queued second', now[0])))
+    wol.run_schedule(queue, lambda: now[0], sleep)
+
+    self.assertEqual(ran, [('early', 1.0), ('early, queued second', 1.0), ('late', 5.0)])
+    self.assertEqual(sleeps, [1.0, 4.0])
+
+  def run_dry(self, hosts: list[dict], stages: list[dict]) -> list[str]:
+    with tempfile.TemporaryDirectory() as tempDir:
+      planPath = os.path.join(tempDir, 'plan.json')
+      with open(planPath, 'w', encoding='utf-8') as planFile:
+        json.dump({'hosts': hosts, 'stages': stages}, planFile)
+
+      plan = wol.load_plan(planPath)
+
+    outputBuffer = io.StringIO()
+    with contextlib.redirect_stdout(outputBuffer):
+      self.assertEqual(wol.run_plan(plan, INTERFACES, dry_run=True), 0)
+
+    return [line.removeprefix('[DRY RUN] ') for line in outputBuffer.getvalue().splitlines()]
+
+  def test_dry_run_plan_timing(self):
+    hosts = [
+      {
+        'name': f'nas{number}', 'mac': f'de:ad:be:ef:00:0{number}', 'ip': f'192.0.2.{number}',
+        'groups': ['storage'],
+      }
+      for number in range(1, 4)
+    ] + [{'name': 'hv1', 'mac': 'de:ad:be:ef:00:10', 'groups': ['hypervisors']}]
+    stages = [
+      {'name': 'storage', 'select': ['storage'], 'waveSize': 2, 'waveDelay': 10},
+      {'name': 'hypervisors', 'select': ['hypervisors'], 'waitForPrevious': True, 'waveDelay': 30},
+      {'name': 'rest', 'select': ['nas1']},
+    ]
+
+    self.assertEqual(self.run_dry(hosts, stages), [
+      "[+     0.0s] Stage 'storage': 3 host(s) in 2 wave(s)",
+      "[+     0.0s] Stage 'storage' wave 1/2: sent 2 of 2",
+      "[+    10.0s] Stage 'storage' wave 2/2: sent 1 of 1",
+      "[+    10.0s] Stage 'storage' verified up",
+      "[+    10.0s] Stage 'hypervisors': 1 host(s) in 1 wave(s)",
+      "[+    10.0s] Stage 'hypervisors' wave 1/1: sent 1 of 1",
+      "[+    40.0s] Stage 'rest': 1 host(s) in 1 wave(s)",
+      "[+    40.0s] Stage 'rest' wave 1/1: sent 1 of 1",
+    ])
+
+  def test_dry_run_needs_a_plan(self):
+    with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as caught:
+      wol.main(['--dry-run', 'de:ad:be:ef:00:01'])
+
+    self.assertEqual(caught.exception.code, 2)
+
+
+if __name__ == '__main__':
+  unittest.main()
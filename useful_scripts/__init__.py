@@ -0,0 +1,13 @@
+"""
+ Program: Useful_Scripts package
+    Name: Andrew Dixon            File: __init__.py
+    Date: 19 Oct 2026
+   Notes: Kept empty on purpose. Subcommand modules are imported by the CLI only when they are
+          invoked, so importing the package stays cheap.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
@@ -0,0 +1,17 @@
+"""
+ Program: Useful_Scripts package
+    Name: Andrew Dixon            File: __main__.py
+    Date: 19 Oct 2026
+   Notes: Lets the package run as "python -m useful_scripts".
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
+
+from useful_scripts.cli import main
+
+if __name__ == '__main__':
+  raise SystemExit(main())
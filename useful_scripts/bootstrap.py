@@ -0,0 +1,1418 @@
+#!/usr/bin/env python3
+
+"""
+ Program: ProjectBootstrap
+    Name: Andrew Dixon            File: bootstrap.py
+    Date: 11 Feb 2026
+   Notes: Scripting to import/replace uv default files so I do not have to do it by hand.
+   TODO: Add comments and clean up code. Large swaths of this are basically AI generated and only briefly tested.
+
+  Copyright (c) 2026 Andrew Dixon
+
+   This file is part of Useful_Scripts.
+   Licensed under the GNU Lesser General Public License v2.1.
+   See the LICENSE file at the project root for details.
+
+........1.........2.........3.........4.........5.........6.........7.........8.........9.........0.........1.........2.........3..
+"""
+
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import json
+import shutil
+import difflib
+import hashlib
+import argparse
+import datetime
+import functools
+import tomllib
+import platform
+import threading
+import subprocess
+from pathlib import Path
+from typing import Any, Callable, TextIO
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+TemplateType = dict[str, Any]
+SpecialParserType = Callable[[list[str], TemplateType], list[str]]
+TaskGraphType = dict[str, tuple[Callable[..., Any], tuple[str, ...]]]
+MergeFuncType = Callable[[list[str], list[str]], list[str]]
+PlanEntryType = dict[str, Any]
+
+# Merged-in entries are appended below this marker, so later runs know where to add more.
+MERGE_MARKER: str = 'Added by Project-Bootstrap'
+
+# Existing files larger than this are compared by digest only; no diff is computed.
+PLAN_MAX_DIFF_BYTES: int = 4 * 1024 * 1024
+
+pythonVersionRaw: str = ''
+pythonVersionMajor: int = 0
+pythonVersionMinor: int = 0
+pythonVersionPatch: int | None = None
+
+
+def main(argv: list[str] | None = None, prog: str | None = None) -> int:
+  parser = argparse.ArgumentParser(
+    prog=prog,
+    description='Apply embedded templates to a uv project, optionally copying global defaults, with per-file parsing.'
+  )
+  parser.add_argument(
+    '--dry-run',
+    '--dryrun',
+    action='store_true',
+    help='Show actions without writing files.'
+  )
+  parser.add_argument(
+    '--force',
+    action='store_true',
+    help='Overwrite files even if they already exist.'
+  )
+  parser.add_argument(
+    '--plan',
+    action='store_true',
+    help='Show whether each file would be new, unchanged or modified, with a diff. Writes nothing.'
+  )
+  parser.add_argument(
+    '--plan-json',
+    metavar='FILE',
+    help='Also write the plan as JSON to FILE ("-" for stdout). Implies --plan.'
+  )
+  parser.add_argument(
+    '--diff-lines',
+    type=int,
+    default=200,
+    help='Maximum diff lines shown per file in --plan (default: %(default)s).'
+  )
+  parser.add_argument(
+    '--jobs',
+    type=int,
+    default=min(32, (os.cpu_count() or 1) + 4),
+    help='Template tasks run in parallel (default: %(default)s). Use 1 to run them in order.'
+  )
+
+  args = parser.parse_args(argv)
+
+  projectDirPath: Path = Path.cwd()
+  assertUvLikeProject(projectDirPath)
+  loadPythonVersion(projectDirPath)
+
+  planMode = bool(args.plan or args.plan_json)
+
+  planEntries = processTemplates(
+    projectDirPath=projectDirPath,
+    templatesList=EMBEDDED_TEMPLATES,
+    dryRun=bool(args.dry_run),
+    cliForce=bool(args.force),
+    jobs=max(1, int(args.jobs)),
+    planMode=planMode,
+    diffLimit=max(0, int(args.diff_lines)),
+    # Keep stdout pure JSON when the plan itself is written there.
+    logFile=sys.stderr if args.plan_json == '-' else None,
+  )
+
+  if args.plan_json:
+    planText = json.dumps({'project': str(projectDirPath), 'files': planEntries}, indent=2)
+
+    if args.plan_json == '-':
+      print(planText)
+    else:
+      Path(args.plan_json).write_text(planText + '\n', encoding='utf-8')
+
+  return 0
+
+
+def assertUvLikeProject(projectDirPath: Path) -> None:
+  requiredPaths = [projectDirPath / 'pyproject.toml', projectDirPath / '.python-version']
+
+  missingNames = [pathObj.name for pathObj in requiredPaths if not pathObj.exists()]
+  if missingNames:
+    raise SystemExit(
+      'Refusing to run: this does not look like a uv project root.\n'
+      f'Missing: {", ".join(missingNames)}\n'
+      f'Current directory: {projectDirPath}'
+    )
+
+
+def loadPythonVersion(projectDirPath: Path) -> None:
+  global pythonVersionRaw
+  global pythonVersionMajor
+  global pythonVersionMinor
+  global pythonVersionPatch
+
+  pythonVersionPath: Path = projectDirPath / '.python-version'
+  pythonVersionRaw = pythonVersionPath.read_text(encoding='utf-8').strip()
+
+  matchObj: re.Match[str] | None = re.search(r'(\d+)\.(\d+)(?:\.(\d+))?', pythonVersionRaw)
+  if not matchObj:
+    raise RuntimeError(f'Could not parse .python-version content: {pythonVersionRaw!r}')
+
+  pythonVersionMajor = int(matchObj.group(1))
+  pythonVersionMinor = int(matchObj.group(2))
+  pythonVersionPatch = int(matchObj.group(3)) if matchObj.group(3) is not None else None
+
+
+def pythonVersionUpdate(style: str) -> str:
+  majorVersion: int = pythonVersionMajor
+  minorVersion: int = pythonVersionMinor
+  patchVersion: int | None = pythonVersionPatch
+
+  if style == 'majorMinor':
+    return f'{majorVersion}.{minorVersion}'
+
+  if style == 'majorMinorPatch':
+    if patchVersion is None:
+      return f'{majorVersion}.{minorVersion}'
+
+    return f'{majorVersion}.{minorVersion}.{patchVersion}'
+
+  if style == 'ruffTarget':
+    return f'py{majorVersion}{minorVersion:02d}'
+
+  if style == 'noDot':
+    return f'{majorVersion}{minorVersion:02d}'
+
+  if style == 'cpythonTag':
+    return f'cp{majorVersion}{minorVersion:02d}'
+
+  raise ValueError(f'Unknown version style: {style!r}')
+
+
+def expandUserPath(pathText: str) -> Path:
+  expandedText: str = os.path.expandvars(os.path.expanduser(pathText))
+
+  return Path(expandedText)
+
+
+def readLines(pathObj: Path) -> list[str]:
+  return pathObj.read_text(encoding='utf-8').splitlines(keepends=True)
+
+
+def normalizeLines(linesList: list[str]) -> list[str]:
+  if not linesList:
+    return ['\n']
+
+  normalizedList: list[str] = []
+  for line in linesList:
+    normalizedList.append(line if line.endswith('\n') else line + '\n')
+
+  if not normalizedList[-1].endswith('\n'):
+    normalizedList[-1] = normalizedList[-1] + '\n'
+
+  return normalizedList
+
+
+def embeddedToLines(embeddedConfig: Any) -> list[str]:
+  if isinstance(embeddedConfig, str):
+    return normalizeLines(embeddedConfig.splitlines(keepends=True))
+
+  if isinstance(embeddedConfig, (list, tuple)):
+    return normalizeLines([str(lineObj) for lineObj in embeddedConfig])
+
+  raise TypeError('embeddedConfig must be a string, list, or tuple')
+
+
+def findGlobalDefault(templateObj: TemplateType) -> Path | None:
+  globalDefaults = templateObj.get('globalDefaults', {})
+  systemName: str = platform.system()
+
+  defaultPathText = globalDefaults.get(systemName)
+  if not defaultPathText:
+    return None
+
+  defaultPath = expandUserPath(str(defaultPathText))
+  if defaultPath.exists() and defaultPath.is_file():
+    return defaultPath
+
+  return None
+
+
+def sanitizeOutputPath(outputPathText: str) -> Path:
+  # - If "~" appears anywhere OR any ".." traversal appears, drop to project root.
+  if '~' in outputPathText:
+    return Path('.')
+
+  rawPath = Path(outputPathText)
+
+  for part in rawPath.parts:
+    if part == '..':
+      return Path('.')
+
+  # Treat absolute paths as relative under project root by stripping anchor/root.
+  if rawPath.is_absolute():
+    relativeParts: list[str] = list(rawPath.parts)
+
+    if relativeParts:
+      relativeParts: list[str] = relativeParts[1:]
+
+    return Path(*relativeParts) if relativeParts else Path('.')
+
+  # Also strip leading "./" noise naturally
+  return rawPath
+
+
+def upsertRuffTargetVersion(linesList: list[str]) -> list[str]:
+  # Insert/replace an active target-version setting.
+  desiredLine = f'target-version = "{pythonVersionUpdate("ruffTarget")}"'
+  activeRegex: re.Pattern[str] = re.compile(r'^\s*target-version\s*=\s*"[^"]*"\s*$')
+
+  linesList = normalizeLines(linesList)
+
+  for index, line in enumerate(linesList):
+    if activeRegex.match(line.strip()):
+      linesList[index] = desiredLine + '\n'
+      return linesList
+
+  anchorRegex: re.Pattern[str] = re.compile(r'^\s*(line-length|indent-width)\s*=\s*')
+
+  lastAnchorIndex = None
+  for index, line in enumerate(linesList):
+    if anchorRegex.search(line):
+      lastAnchorIndex: int = index
+
+  insertIndex = 0
+  if lastAnchorIndex is not None:
+    insertIndex: int = lastAnchorIndex + 1
+
+    if insertIndex < len(linesList) and linesList[insertIndex].strip() != '':
+      linesList.insert(insertIndex, '\n')
+      insertIndex += 1
+
+  else:
+    for index, line in enumerate(linesList):
+      strippedLine: str = line.strip()
+
+      if strippedLine.startswith('#') or strippedLine == '':
+        continue
+
+      insertIndex: int = index
+      break
+
+  linesList.insert(insertIndex, desiredLine + '\n')
+
+  return linesList
+
+
+def upsertTyEnvironmentPythonVersion(linesList: list[str]) -> list[str]:
+  desiredLine = f'python-version = "{pythonVersionUpdate("majorMinor")}"'
+  sectionHeaderRegex: re.Pattern[str] = re.compile(r'^\s*\[environment\]\s*$')
+  anySectionHeaderRegex: re.Pattern[str] = re.compile(r'^\s*\[[^\]]+\]\s*$')
+  keyRegex: re.Pattern[str] = re.compile(r'^\s*python-version\s*=\s*"[^"]*"\s*$')
+
+  linesList: list[str] = normalizeLines(linesList)
+
+  sectionStartIndex = None
+  for index, line in enumerate(linesList):
+    if sectionHeaderRegex.match(line):
+      sectionStartIndex: int = index
+      break
+
+  if sectionStartIndex is None:
+    prefix = ['[environment]\n', desiredLine + '\n', '\n']
+    return prefix + linesList
+
+  sectionEndIndex: int = len(linesList)
+  for index in range(sectionStartIndex + 1, len(linesList)):
+    if anySectionHeaderRegex.match(linesList[index]):
+      sectionEndIndex: int = index
+      break
+
+  sectionSlice: list[str] = linesList[sectionStartIndex:sectionEndIndex]
+
+  replaced = False
+  for localIndex, line in enumerate(sectionSlice):
+    if keyRegex.match(line.strip()):
+      sectionSlice[localIndex] = desiredLine + '\n'
+      replaced = True
+      break
+
+  if not replaced:
+    sectionSlice.insert(1, desiredLine + '\n')
+
+  # Ensure a blank line before the next section header
+  while sectionSlice and sectionSlice[-1] == '\n':
+    sectionSlice.pop()
+  sectionSlice.append('\n')
+  sectionSlice.append('\n')
+
+  return linesList[:sectionStartIndex] + sectionSlice + linesList[sectionEndIndex:]
+
+
+def parseRuffTemplate(linesList: list[str], templateObj: TemplateType) -> list[str]:
+  return upsertRuffTargetVersion(linesList)
+
+
+def parseTyTemplate(linesList: list[str], templateObj: TemplateType) -> list[str]:
+  return upsertTyEnvironmentPythonVersion(linesList)
+
+
+def parseMainPyTemplate(linesList: list[str], templateObj: TemplateType) -> list[str]:
+  projectDirPath = Path.cwd()
+
+  replacements = {
+    'project' : getProjectName(projectDirPath),
+    'description': getProjectName(projectDirPath),
+    'author': getUserName(),
+    'date': formatDateForHeader(datetime.date.today()),
+    'filename': Path(templateObj.get('fileName', '')).name,
+  }
+
+  updatedLines = replaceTemplateKeys(linesList, replacements)
+
+  # Normalize first-line shebang if present
+  if updatedLines:
+    updatedLines[0] = normalizeMainShebang(updatedLines[0])
+
+  return updatedLines
+
+
+def writeFileIfNeeded(outputFilePath: Path, linesList: list[str],
+                        effectiveForce: bool, dryRun: bool) -> bool:
+
+  if outputFilePath.exists() and not effectiveForce:
+    return False
+
+  contentText: str = ''.join(normalizeLines(linesList))
+
+  if dryRun:
+    return True
+
+  outputFilePath.write_text(contentText, encoding='utf-8')
+  return True
+
+
+def getProjectName(projectDirPath: Path) -> str:
+  folderName = projectDirPath.name
+
+  if not folderName:
+    return ''
+
+  return folderName[0].upper() + folderName[1:]
+
+
+def formatDateForHeader(dateObj: datetime.date) -> str:
+  # "D Mon YYYY" (no leading zero on day)
+  return f'{dateObj.day} {dateObj.strftime("%b")} {dateObj.year}'
+
+
+def runCommandCapture(commandParts: list[str]) -> str:
+  try:
+    resultObj = subprocess.run(
+      commandParts, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=False
+    )
+
+  except Exception:
+    return ''
+
+  if resultObj.returncode != 0:
+    return ''
+
+  return (resultObj.stdout or '').strip()
+
+
+def getUserNameFromGit() -> str:
+  gitPath = shutil.which('git')
+  if not gitPath:
+    return ''
+
+  nameText = runCommandCapture([gitPath, 'config', '--global', 'user.name'])
+  return nameText.strip()
+
+
+def getUserNameFromGh() -> str:
+  ghPath = shutil.which('gh')
+  if not ghPath:
+    return ''
+
+  # Prefer the human name; fallback to login if name isn't set.
+  nameText = runCommandCapture([ghPath, 'api', 'user', '-q', '.name'])
+  if nameText:
+    return nameText.strip()
+
+  loginText = runCommandCapture([ghPath, 'api', 'user', '-q', '.login'])
+
+  return loginText.strip()
+
+
+# Parse tasks run on a thread pool, and functools.cache alone lets two of them miss at once.
+# The lock makes the first caller run git (and gh) while the others wait for its answer.
+userNameLock = threading.Lock()
+
+
+def getUserName() -> str:
+  with userNameLock:
+    return lookupUserName()
+
+
+@functools.cache
+def lookupUserName() -> str:
+  nameText = getUserNameFromGit()
+  if nameText:
+    return nameText
+
+  nameText = getUserNameFromGh()
+  if nameText:
+    return nameText
+
+  return ''
+
+
+def normalizeMainShebang(lineText: str) -> str:
+  strippedText = lineText.strip()
+
+  if strippedText.startswith(r'#!') and '/usr/bin/env' in strippedText and 'python3' in strippedText:
+    return '#!/usr/bin/env python3\n'
+
+  return lineText if lineText.endswith('\n') else lineText + '\n'
+
+
+def x_replaceTemplateKeys(linesList: list[str], replacements: dict[str, str]) -> list[str]:
+  # Replace ${key} occurrences everywhere; unknown keys are left as-is.
+  updatedLines: list[str] = []
+  keyRegex = re.compile(r'\#\{([A-Za-z0-9_]+)\}')
+
+  for rawLine in normalizeLines(linesList):
+    lineText = rawLine
+
+    def replaceMatch(matchObj: re.Match[str]) -> str:
+      keyName = matchObj.group(1)
+      return replacements.get(keyName, matchObj.group(0))
+
+    lineText = keyRegex.sub(replaceMatch, lineText)
+    updatedLines.append(lineText)
+
+  return updatedLines
+
+
+def replaceTemplateKeys(linesList: list[str], replacements: dict[str, str]) -> list[str]:
+  updatedLines: list[str] = []
+  keyRegex: re.Pattern[str] = re.compile(r'#\{([A-Za-z0-9_]+)\}')
+
+  for rawLine in normalizeLines(linesList):
+    lineText: str = rawLine
+
+    def replaceMatch(matchObj: re.Match[str]) -> str:
+      keyName = matchObj.group(1)
+      replacementText: str = replacements.get(keyName, matchObj.group(0))
+
+      # Special case: avoid filename.ext.ext when template does "#{filename}.py"
+      if keyName == 'filename' and replacementText:
+        # startIndex: int = matchObj.start()
+        endIndex: int = matchObj.end()
+        suffixText: str = lineText[endIndex:]
+        extMatch: re.Match[str] | None = re.match(r'(\.[A-Za-z0-9]+)', suffixText)
+
+        if extMatch:
+          extText = extMatch.group(1)
+
+          if replacementText.endswith(extText):
+            return Path(replacementText).stem
+
+      return replacementText
+
+    lineText: str = keyRegex.sub(replaceMatch, lineText)
+    updatedLines.append(lineText)
+
+  return updatedLines
+
+
+def runTaskGraph(
+  taskGraph: TaskGraphType, jobs: int, onComplete: Callable[[str, Any], None] | None = None
+) -> dict[str, Any]:
+  # Each task is (callable, dependency names); the callable receives its dependencies'
+  # results as positional arguments. A task starts as soon as everything it depends on has
+  # finished, and onComplete is always called from this (the calling) thread. After a task
+  # fails nothing new is started, like a serial run; tasks already running may finish.
+  pendingMap: TaskGraphType = dict(taskGraph)
+  runningMap: dict[Future[Any], str] = {}
+  resultsMap: dict[str, Any] = {}
+  errorsMap: dict[str, BaseException] = {}
+
+  with ThreadPoolExecutor(max_workers=jobs) as pool:
+    while (pendingMap and not errorsMap) or runningMap:
+      for taskName, (taskFunc, dependsOn) in list(pendingMap.items()):
+        if errorsMap:
+          break
+
+        if all(depName in resultsMap for depName in dependsOn):
+          dependencyResults = [resultsMap[depName] for depName in dependsOn]
+          runningMap[pool.submit(taskFunc, *dependencyResults)] = taskName
+          del pendingMap[taskName]
+
+      if not runningMap:
+        if pendingMap and not errorsMap:
+          raise RuntimeError(f'Task graph has a cycle or missing dependency: {sorted(pendingMap)}')
+        break
+
+      doneSet, _ = wait(runningMap, return_when=FIRST_COMPLETED)
+      for futureObj in doneSet:
+        taskName = runningMap.pop(futureObj)
+
+        try:
+          resultsMap[taskName] = futureObj.result()
+        except Exception as errorObj:
+          errorsMap[taskName] = errorObj
+          continue
+
+        if onComplete is not None:
+          onComplete(taskName, resultsMap[taskName])
+
+  # Report the failure of the earliest task in graph order, as a serial run would have.
+  for taskName in taskGraph:
+    if taskName in errorsMap:
+      raise errorsMap[taskName]
+
+  return resultsMap
+
+
+def resolveTemplateSource(templateObj: TemplateType) -> tuple[list[str], str]:
+  globalDefaultPath = findGlobalDefault(templateObj)
+
+  if globalDefaultPath:
+    return readLines(globalDefaultPath), f'global default {globalDefaultPath}'
+
+  return embeddedToLines(templateObj.get('embeddedConfig', ())), 'embedded config'
+
+
+def parseTemplateSource(
+  templateObj: TemplateType, sourceObj: tuple[list[str], str]
+) -> tuple[list[str], str]:
+  sourceLines, sourceLabel = sourceObj
+
+  specialParser = templateObj.get('specialParser')
+  if callable(specialParser):
+    sourceLines = specialParser(sourceLines, templateObj)
+
+  return sourceLines, sourceLabel
+
+
+def mergeLineSets(existingLines: list[str], templateLines: list[str]) -> list[str]:
+  # Union of two line lists (e.g. .gitignore): existing lines keep their order and comments,
+  # and template entries not already present are appended under the marker section.
+  seenEntries: set[str] = {line.strip() for line in existingLines}
+  missingLines: list[str] = []
+
+  for line in templateLines:
+    entryText = line.strip()
+    if not entryText or entryText.startswith('#') or entryText in seenEntries:
+      continue
+
+    seenEntries.add(entryText)
+    missingLines.append(entryText + '\n')
+
+  if not missingLines:
+    return existingLines
+
+  mergedLines: list[str] = list(existingLines)
+  markerLine = f'# {MERGE_MARKER}\n'
+
+  if markerLine in mergedLines:
+    # Extend the existing marker block rather than starting a second one.
+    insertIndex = mergedLines.index(markerLine) + 1
+    while insertIndex < len(mergedLines) and mergedLines[insertIndex].strip():
+      insertIndex += 1
+
+    return mergedLines[:insertIndex] + missingLines + mergedLines[insertIndex:]
+
+  if mergedLines and mergedLines[-1].strip():
+    mergedLines.append('\n')
+
+  return mergedLines + [markerLine] + missingLines
+
+
+def findArrayClose(
+  linesList: list[str], lineIndex: int, column: int
+) -> tuple[int, int, tuple[int, int]]:
+  # Walk from the opening '[' to its matching ']', skipping strings and comments, so a '['
+  # inside "*.py[co]" or a trailing comment is not mistaken for the end of the array.
+  # Returns the closing line and column, and the position of the last token before it.
+  depthCount = 0
+  quoteText = ''
+  lastPos = (lineIndex, column)
+
+  while lineIndex < len(linesList):
+    line = linesList[lineIndex]
+
+    while column < len(line):
+      charText = line[column]
+
+      if quoteText:
+        if charText == '\\' and quoteText.startswith('"'):
+          column += 2
+          continue
+
+        if line.startswith(quoteText, column):
+          column += len(quoteText)
+          lastPos = (lineIndex, column - 1)
+          quoteText = ''
+          continue
+
+      elif charText == '#':
+        break
+
+      elif line.startswith(('"""', "'''"), column):
+        quoteText = line[column:column + 3]
+        column += 3
+        continue
+
+      elif charText in '"\'':
+        quoteText = charText
+
+      elif charText == '[':
+        depthCount += 1
+
+      elif charText == ']':
+        depthCount -= 1
+        if not depthCount:
+          return lineIndex, column, lastPos
+
+      if not charText.isspace():
+        lastPos = (lineIndex, column)
+      column += 1
+
+    lineIndex += 1
+    column = 0
+
+  raise ValueError('unterminated array')
+
+
+def findTomlArrays(linesList: list[str]) -> dict[tuple[str, str], dict[str, Any]]:
+  # Locate "key = [ ... ]" arrays, keyed by (section, key). Only positions are recorded here;
+  # the values come from tomllib, which knows the quoting and escaping rules.
+  sectionRegex: re.Pattern[str] = re.compile(r'^\s*\[([^\[\]]+)\]\s*(#.*)?$')
+  arrayStartRegex: re.Pattern[str] = re.compile(r'^(\s*)([A-Za-z0-9_.-]+)\s*=\s*\[')
+
+  arraysMap: dict[tuple[str, str], dict[str, Any]] = {}
+  sectionName = ''
+  index = 0
+
+  while index < len(linesList):
+    line = linesList[index]
+    sectionMatch = sectionRegex.match(line)
+    startMatch = arrayStartRegex.match(line)
+
+    if sectionMatch:
+      sectionName = sectionMatch.group(1).strip()
+
+    if not startMatch:
+      index += 1
+      continue
+
+    endIndex, closeColumn, lastPos = findArrayClose(linesList, index, startMatch.end() - 1)
+
+    arraysMap[(sectionName, startMatch.group(2))] = {
+      'start': index, 'end': endIndex, 'close': closeColumn, 'last': lastPos
+    }
+    index = endIndex + 1
+
+  return arraysMap
+
+
+def lookupTomlValue(dataObj: dict[str, Any], arrayKey: tuple[str, str]) -> Any:
+  # Dotted section and key names are split on '.'; quoted names simply fail to match.
+  sectionName, keyName = arrayKey
+  valueObj: Any = dataObj
+
+  for partText in (sectionName.split('.') if sectionName else []) + keyName.split('.'):
+    valueObj = valueObj.get(partText.strip()) if isinstance(valueObj, dict) else None
+
+  return valueObj
+
+
+def parseTomlLines(linesList: list[str], labelText: str) -> dict[str, Any]:
+  try:
+    return tomllib.loads(''.join(linesList))
+  except tomllib.TOMLDecodeError as errorObj:
+    raise ValueError(f'{labelText} is not valid TOML ({errorObj})') from errorObj
+
+
+def mergeTomlArrays(existingLines: list[str], templateLines: list[str]) -> list[str]:
+  # Add template array items (ruff/ty "exclude = [...]") missing from the same array in the
+  # existing file. Arrays the existing file does not define are left out on purpose. Raises
+  # ValueError when the result would not parse back to exactly the intended arrays.
+  templateData = parseTomlLines(templateLines, 'template')
+  existingData = parseTomlLines(existingLines, 'existing file')
+  templateArrays = findTomlArrays(templateLines)
+  existingArrays = findTomlArrays(existingLines)
+  mergedLines: list[str] = list(existingLines)
+  expectedMap: dict[tuple[str, str], list[Any]] = {}
+
+  # Edit from the bottom up so earlier line numbers stay valid.
+  for arrayKey in sorted(existingArrays, key=lambda key: -existingArrays[key]['start']):
+    existingItems = lookupTomlValue(existingData, arrayKey)
+    templateItems = lookupTomlValue(templateData, arrayKey)
+    if arrayKey not in templateArrays or not isinstance(existingItems, list):
+      continue
+    if not isinstance(templateItems, list):
+      continue
+
+    missingItems: list[str] = []
+    for itemObj in templateItems:
+      if isinstance(itemObj, str) and itemObj not in existingItems and itemObj not in missingItems:
+        missingItems.append(itemObj)
+
+    if not missingItems:
+      continue
+
+    expectedMap[arrayKey] = existingItems + missingItems
+    itemTexts: list[str] = [json.dumps(itemText) for itemText in missingItems]
+
+    arrayObj = existingArrays[arrayKey]
+    startIndex: int = arrayObj['start']
+    endIndex: int = arrayObj['end']
+    lastIndex, lastColumn = arrayObj['last']
+    lastChar: str = mergedLines[lastIndex][lastColumn]
+
+    if lastIndex == endIndex:
+      # The closing bracket shares its line with the last item (or the opening bracket), so
+      # add the items inline, right after that token.
+      line = mergedLines[endIndex]
+      separatorText = '' if lastChar == '[' else ' ' if lastChar == ',' else ', '
+      mergedLines[endIndex] = (
+        line[:lastColumn + 1] + separatorText + ', '.join(itemTexts) + line[lastColumn + 1:]
+      )
+      continue
+
+    itemLines = [
+      line for line in mergedLines[startIndex + 1:endIndex]
+      if line.strip() and not line.strip().startswith('#')
+    ]
+    indentText = re.match(r'\s*', itemLines[0]).group(0) if itemLines else '  '
+
+    # The last existing item needs a trailing comma before new items follow it.
+    if lastChar not in '[,':
+      line = mergedLines[lastIndex]
+      mergedLines[lastIndex] = line[:lastColumn + 1] + ',' + line[lastColumn + 1:]
+
+    markerLine = f'{indentText}# {MERGE_MARKER}\n'
+    newLines = [f'{indentText}{itemText},\n' for itemText in itemTexts]
+    if markerLine not in mergedLines[startIndex:endIndex]:
+      newLines.insert(0, markerLine)
+
+    mergedLines[endIndex:endIndex] = newLines
+
+  if expectedMap:
+    mergedData = parseTomlLines(mergedLines, 'merged file')
+    for arrayKey, expectedItems in expectedMap.items():
+      if lookupTomlValue(mergedData, arrayKey) != expectedItems:
+        raise ValueError(f'merging {".".join(filter(None, arrayKey))} did not give the expected array')
+
+  return mergedLines
+
+
+MERGE_STRATEGIES: dict[str, MergeFuncType] = {
+  'lines': mergeLineSets,
+  'tomlArrays': mergeTomlArrays,
+}
+
+
+def applyMerge(
+  outputFilePath: Path, sourceLines: list[str], mergeFunc: MergeFuncType | None
+) -> tuple[list[str], bool]:
+  if mergeFunc is None or not outputFilePath.exists():
+    return sourceLines, False
+
+  existingLines = normalizeLines(readLines(outputFilePath))
+
+  return mergeFunc(existingLines, normalizeLines(sourceLines)), True
+
+
+def writeTemplate(
+  outputFilePath: Path, effectiveForce: bool, dryRun: bool, mergeFunc: MergeFuncType | None,
+  parsedObj: tuple[list[str], str], *_waitFor: Any
+) -> tuple[str, PlanEntryType | None]:
+  sourceLines, sourceLabel = parsedObj
+  prefixText = '[DRY RUN] ' if dryRun else ''
+
+  try:
+    sourceLines, merged = applyMerge(outputFilePath, sourceLines, mergeFunc)
+  except ValueError as errorObj:
+    return f'{prefixText}Skipped (could not merge: {errorObj}): {outputFilePath}', None
+
+  if merged:
+    if sourceLines == normalizeLines(readLines(outputFilePath)):
+      return f'{prefixText}Unchanged (merged): {outputFilePath}', None
+
+    actionText = 'Would merge' if dryRun else 'Merged'
+    writeFileIfNeeded(outputFilePath, sourceLines, effectiveForce=True, dryRun=dryRun)
+    return f'{prefixText}{actionText}: {outputFilePath} with {sourceLabel}', None
+
+  wrote = writeFileIfNeeded(
+    outputFilePath=outputFilePath,
+    linesList=sourceLines,
+    effectiveForce=effectiveForce,
+    dryRun=dryRun,
+  )
+
+  if wrote:
+    actionText = 'Would write' if dryRun else 'Wrote'
+    forceText = ' (forced)' if effectiveForce and outputFilePath.exists() else ''
+    return f'{prefixText}{actionText}: {outputFilePath} from {sourceLabel}{forceText}', None
+
+  return f'{prefixText}Skipped (exists): {outputFilePath}', None
+
+
+def fileDigest(pathObj: Path) -> str:
+  with pathObj.open('rb') as fileObj:
+    return hashlib.file_digest(fileObj, newDigest).hexdigest()
+
+
+def newDigest() -> Any:
+  return hashlib.blake2b(digest_size=16)
+
+
+def planTemplate(
+  outputFilePath: Path, effectiveForce: bool, diffLimit: int, mergeFunc: MergeFuncType | None,
+  parsedObj: tuple[list[str], str], *_waitFor: Any
+) -> tuple[str, PlanEntryType]:
+  # Decide new/unchanged/modified from sizes and digests first; only files that really
+  # differ are diffed, and only the first diffLimit diff lines are kept.
+  sourceLines, sourceLabel = parsedObj
+
+  try:
+    sourceLines, merged = applyMerge(outputFilePath, sourceLines, mergeFunc)
+  except ValueError as errorObj:
+    # A merge that cannot be done safely leaves the existing file alone.
+    merged, effectiveForce = False, False
+    sourceLabel = f'{sourceLabel} (could not merge: {errorObj})'
+
+  if merged:
+    effectiveForce = True
+    sourceLabel = f'{sourceLabel} (merged)'
+  renderedLines: list[str] = normalizeLines(sourceLines)
+  renderedBytes: bytes = ''.join(renderedLines).encode('utf-8')
+  renderedDigestObj = newDigest()
+  renderedDigestObj.update(renderedBytes)
+  renderedDigest: str = renderedDigestObj.hexdigest()
+
+  planEntry: PlanEntryType = {
+    'path': str(outputFilePath),
+    'source': sourceLabel,
+    'status': 'new',
+    'bytes': len(renderedBytes),
+    'digest': renderedDigest,
+    'linesAdded': len(renderedLines),
+    'linesRemoved': 0,
+    'bytesChanged': len(renderedBytes),
+    'diff': [],
+    'diffTruncated': False,
+  }
+
+  if outputFilePath.exists():
+    existingSize: int = outputFilePath.stat().st_size
+
+    if not effectiveForce:
+      planEntry.update(status='skipped', linesAdded=0, bytesChanged=0)
+
+    elif existingSize == len(renderedBytes) and fileDigest(outputFilePath) == renderedDigest:
+      planEntry.update(status='unchanged', linesAdded=0, bytesChanged=0)
+
+    elif existingSize > PLAN_MAX_DIFF_BYTES:
+      planEntry.update(
+        status='modified', linesAdded=None, linesRemoved=None,
+        bytesChanged=abs(existingSize - len(renderedBytes)), diffTruncated=True,
+      )
+
+    else:
+      planEntry.update(status='modified', linesAdded=0, bytesChanged=0)
+      diffLines: list[str] = planEntry['diff']
+
+      diffIter = difflib.unified_diff(
+        readLines(outputFilePath), renderedLines,
+        fromfile=f'{outputFilePath} (current)', tofile=f'{outputFilePath} (planned)',
+      )
+
+      for diffLine in diffIter:
+        if diffLine.startswith(('+++', '---')):
+          pass
+        elif diffLine.startswith('+'):
+          planEntry['linesAdded'] += 1
+          planEntry['bytesChanged'] += len(diffLine.encode('utf-8')) - 1
+        elif diffLine.startswith('-'):
+          planEntry['linesRemoved'] += 1
+          planEntry['bytesChanged'] += len(diffLine.encode('utf-8')) - 1
+
+        if len(diffLines) < diffLimit:
+          diffLines.append(diffLine if diffLine.endswith('\n') else diffLine + '\n')
+        else:
+          planEntry['diffTruncated'] = True
+
+  return formatPlanEntry(planEntry), planEntry
+
+
+def formatPlanEntry(planEntry: PlanEntryType) -> str:
+  statusText: str = planEntry['status']
+  detailText: str = f'{planEntry["bytes"]} bytes'
+
+  if statusText == 'new':
+    detailText = f'{planEntry["bytes"]} bytes, {planEntry["linesAdded"]} lines'
+  elif statusText == 'skipped':
+    detailText = 'exists, not forced'
+  elif statusText == 'modified' and planEntry['linesAdded'] is None:
+    detailText = f'~{planEntry["bytesChanged"]} bytes changed, too large to diff'
+  elif statusText == 'modified':
+    detailText = (
+      f'+{planEntry["linesAdded"]} -{planEntry["linesRemoved"]} lines, '
+      f'{planEntry["bytesChanged"]} bytes changed'
+    )
+
+  summaryText = f'[PLAN] {statusText:<9} {planEntry["path"]} ({detailText}) from {planEntry["source"]}'
+
+  if not planEntry['diff']:
+    return summaryText
+
+  truncatedText = '  ... diff truncated\n' if planEntry['diffTruncated'] else ''
+  diffText = ''.join(f'  {diffLine}' for diffLine in planEntry['diff'])
+
+  return f'{summaryText}\n{diffText}{truncatedText}'.rstrip('\n')
+
+
+def processTemplates(
+  projectDirPath: Path, templatesList: tuple[TemplateType, ...], dryRun: bool, cliForce: bool,
+  jobs: int = 1, planMode: bool = False, diffLimit: int = 200,
+  logFile: TextIO | None = None) -> list[PlanEntryType]:
+  # Every template is split into read -> parse -> write tasks, plus one mkdir per output
+  # directory, so reads, identity lookups and writes of different templates overlap. Writes to
+  # the same file stay in template order, and the log is printed in template order.
+  taskGraph: TaskGraphType = {}
+  lastWriteByPath: dict[Path, str] = {}
+
+  for index, templateObj in enumerate(templatesList):
+    fileName = str(templateObj['fileName'])
+    outputPathText = str(templateObj.get('outputPath', './'))
+    templateForce = bool(templateObj.get('force', False))
+    effectiveForce = bool(cliForce or templateForce)
+
+    # --force overwrites everything, merge templates included.
+    mergeName = templateObj.get('merge')
+    if mergeName and mergeName not in MERGE_STRATEGIES:
+      raise ValueError(f'Unknown merge strategy for {fileName}: {mergeName!r}')
+
+    mergeFunc = MERGE_STRATEGIES[mergeName] if mergeName and not cliForce else None
+
+    safeOutputDirRel = sanitizeOutputPath(outputPathText)
+    outputDirPath = (projectDirPath / safeOutputDirRel).resolve()
+    outputFilePath = outputDirPath / fileName
+
+    # A plan must not touch the project, so it skips creating output directories.
+    mkdirTask = f'mkdir:{outputDirPath}'
+    mkdirFunc = functools.partial(outputDirPath.mkdir, parents=True, exist_ok=True)
+    taskGraph.setdefault(mkdirTask, ((lambda: None) if planMode else mkdirFunc, ()))
+
+    taskGraph[f'source:{index}'] = (functools.partial(resolveTemplateSource, templateObj), ())
+    taskGraph[f'parse:{index}'] = (
+      functools.partial(parseTemplateSource, templateObj), (f'source:{index}',)
+    )
+
+    writeDeps: tuple[str, ...] = (f'parse:{index}', mkdirTask)
+    if outputFilePath in lastWriteByPath:
+      writeDeps += (lastWriteByPath[outputFilePath],)
+
+    if planMode:
+      writeFunc = functools.partial(
+        planTemplate, outputFilePath, effectiveForce, diffLimit, mergeFunc
+      )
+    else:
+      writeFunc = functools.partial(
+        writeTemplate, outputFilePath, effectiveForce, dryRun, mergeFunc
+      )
+
+    taskGraph[f'write:{index}'] = (writeFunc, writeDeps)
+    lastWriteByPath[outputFilePath] = f'write:{index}'
+
+  logLines: dict[int, str] = {}
+  nextIndex = 0
+
+  def printInOrder(taskName: str, resultObj: Any) -> None:
+    nonlocal nextIndex
+
+    if not taskName.startswith('write:'):
+      return
+
+    logLines[int(taskName.split(':', 1)[1])] = resultObj[0]
+    while nextIndex in logLines:
+      print(logLines.pop(nextIndex), file=logFile)
+      nextIndex += 1
+
+  try:
+    resultsMap = runTaskGraph(taskGraph, jobs, onComplete=printInOrder)
+  finally:
+    # After a failure, writes that finished behind the failed template are still logged.
+    for index in sorted(logLines):
+      print(logLines[index], file=logFile)
+
+  return [
+    resultsMap[f'write:{index}'][1] for index in range(len(templatesList))
+    if resultsMap[f'write:{index}'][1] is not None
+  ]
+
+# Embeded template configuration and embeded templates to output.
+EMBEDDED_TEMPLATES: tuple[TemplateType, ...] = (
+  {
+    'fileName': 'ruff.toml',
+    'outputPath': './',
+    'force': False,
+    'globalDefaults': {
+      'Darwin': '~/.config/ruff/ruff.toml',
+      'Linux': '~/.config/ruff/ruff.toml',
+      'Windows': r'%APPDATA%\ruff\ruff.toml',
+    },
+    'embeddedConfig': (
+      '# Exclude a variety of commonly ignored directories.',
+      'exclude = [',
+      '    ".bzr",',
+      '    ".direnv",',
+      '    ".eggs",',
+      '    ".git",',
+      '    ".git-rewrite",',
+      '    ".hg",',
+      '    ".ipynb_checkpoints",',
+      '    ".mypy_cache",',
+      '    ".nox",',
+      '    ".pants.d",',
+      '    ".pyenv",',
+      '    ".pytest_cache",',
+      '    ".pytype",',
+      '    ".ruff_cache",',
+      '    ".svn",',
+      '    ".tox",',
+      '    ".venv",',
+      '    ".vscode",',
+      '    "__pypackages__",',
+      '    "_build",',
+      '    "buck-out",',
+      '    "build",',
+      '    "dist",',
+      '    "node_modules",',
+      '    "site-packages",',
+      '    "venv",',
+      ']',
+      '',
+      '# Same as Black.',
+      'line-length = 100',
+      'indent-width = 2',
+      '',
+      '# target-version = ',
+      '',
+      '[lint]',
+      'select = ["E1", "E4", "E7", "E9", "F", "W", "B"]',
+      'ignore = []',
+      '',
+      'fixable = ["ALL"]',
+      'unfixable = ["B"]',
+      '',
+      'dummy-variable-rgx = "^(_+|(_+[a-zA-Z0-9_]*[a-zA-Z0-9]+?))$"',
+      '',
+      '[format]',
+      'quote-style = "single"',
+      'indent-style = "space"',
+      'skip-magic-trailing-comma = true',
+      'line-ending = "auto"',
+      'docstring-code-format = true',
+      'docstring-code-line-length = "dynamic"',
+    ),
+    'specialParser': parseRuffTemplate,
+    'merge': 'tomlArrays',
+  },
+  {
+    'fileName': 'ty.toml',
+    'outputPath': './',
+    'force': False,
+    'globalDefaults': {
+      'Darwin': '~/.config/ty/ty.toml',
+      'Linux': '~/.config/ty/ty.toml',
+      'Windows': r'%APPDATA%\ty\ty.toml',
+    },
+    'embeddedConfig': (
+      '# ty.toml',
+      '# Portable "sane defaults" for solo dev projects:',
+      '# - Respect .gitignore by default',
+      '# - Exclude common junk/venvs/build output explicitly',
+      '# - Keep diagnostics as warnings unless you choose otherwise',
+      '',
+      '[src]',
+      '# include = ["src", "tests"]',
+      '',
+      'exclude = [',
+      '  ".bzr",',
+      '  ".direnv",',
+      '  ".eggs",',
+      '  ".git",',
+      '  ".git-rewrite",',
+      '  ".hg",',
+      '  ".ipynb_checkpoints",',
+      '  ".mypy_cache",',
+      '  ".nox",',
+      '  ".pants.d",',
+      '  ".pyenv",',
+      '  ".pytest_cache",',
+      '  ".pytype",',
+      '  ".ruff_cache",',
+      '  ".svn",',
+      '  ".tox",',
+      '  ".venv",',
+      '  ".vscode",',
+      '  "__pypackages__",',
+      '  "_build",',
+      '  "buck-out",',
+      '  "build",',
+      '  "dist",',
+      '  "node_modules",',
+      '  "site-packages",',
+      '  "venv",',
+      ']',
+      '',
+      '[environment]',
+      '# Keep this aligned with whatever you target in Ruff / your runtime.',
+      '# python-version = "3.14"',
+      '',
+      '[terminal]',
+      'error-on-warning = false',
+      '',
+      '[rules]',
+      'all = "warn"',
+    ),
+    'specialParser': parseTyTemplate,
+    'merge': 'tomlArrays',
+  },
+  {
+    'fileName': 'main.py',
+    'outputPath': './',
+    'force': True,
+    'globalDefaults': {
+      'Darwin': '~/Library/Application Support/Code/User/FileTemplates/python-basic.py',
+      'Linux': '~/.config/Code/User/FileTemplates/python-basic.py',
+      'Windows': r'%APPDATA%\Roaming\Code\User\FileTemplates/python-basic.py',
+    },
+    'embeddedConfig': (
+      r'#! /usr/bin/env python3',
+      '',
+      r"'''",
+      ' Program: #{description}',
+      '    Name: #{author}            File: #{filename}',
+      '    Date: #{date}',
+      '   Notes:',
+      '........1.........2.........3.........4.........5.........6.........7.........8.........9.........0.........1.........2.........3..',
+      r"'''",
+      '',
+      'import atexit',
+      '',
+      "SYMBOLS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'",
+      "SYMBOLS = SYMBOLS + SYMBOLS.lower() + '1234567890 !?.'",
+      '',
+      'def main() -> None:',
+      '  # Code Beginning ----',
+      '  msg = "Hello World!"',
+      '  oprs = [msg.lower, msg.upper, msg.capitalize, msg.swapcase, msg.title]',
+      '',
+      '  for m in oprs:',
+      '    print(m())',
+      '',
+      '# Make sure we clean up anything we need to do if someone aborts the script',
+      'def onExit() -> None:',
+      '  try:',
+      '    # Try and do any clean up, error check as necessary',
+      '    pass',
+      '  except Exception:',
+      '    # Deal with errors, or just ignore them by leaving this as "pass"',
+      '    pass',
+      '  return',
+      '',
+      '# If the hello.py is run (instead of imported as a module),',
+      '# call the main() function:',
+      "if __name__ == '__main__':",
+      '# Register the function to execute on ending the script',
+      '  atexit.register(onExit)',
+      '  main()',
+    ),
+    'specialParser': parseMainPyTemplate,
+  },
+  {
+    'fileName': '.gitignore',
+    'outputPath': './',
+    'force': False,
+    'globalDefaults': {
+      'Darwin': None,
+      'Linux': None,
+      'Windows': None
+    },
+    'embeddedConfig': (
+      '#',
+      '#  Program: gitignore file for #{project}',
+      '#',
+      '',
+      '# Byte-compiled / optimized / DLL files',
+      '__pycache__/',
+      '*.py[cod]',
+      '*$py.class',
+      '',
+      '# C extensions',
+      '*.so',
+      '',
+      '# Distribution / packaging',
+      '.Python',
+      'build/',
+      'develop-eggs/',
+      'dist/',
+      'downloads/',
+      'eggs/',
+      '.eggs/',
+      'lib/',
+      'lib64/',
+      'parts/',
+      'sdist/',
+      'var/',
+      'wheels/',
+      'pip-wheel-metadata/',
+      'share/python-wheels/',
+      '*.egg-info/',
+      '.installed.cfg',
+      '*.egg',
+      'MANIFEST',
+      '',
+      '# PyInstaller',
+      '#  Usually these files are written by a python script from a template',
+      '#  before PyInstaller builds the exe, so as to inject date/other infos into it.',
+      '*.manifest',
+      '*.spec',
+      '',
+      '# Installer logs',
+      'pip-log.txt',
+      'pip-delete-this-directory.txt',
+      '',
+      '# Unit test / coverage reports',
+      'htmlcov/',
+      '.tox/',
+      '.nox/',
+      '.coverage',
+      '.coverage.*',
+      '.cache',
+      'nosetests.xml',
+      'coverage.xml',
+      '*.cover',
+      '*.py,cover',
+      '.hypothesis/',
+      '.pytest_cache/',
+      'cover/',
+      '',
+      '# Translations',
+      '*.mo',
+      '*.pot',
+      '',
+      '# Django stuff:',
+      '*.log',
+      'local_settings.py',
+      'db.sqlite3',
+      'db.sqlite3-journal',
+      '',
+      '# Flask stuff:',
+      'instance/',
+      '.webassets-cache',
+      '',
+      '# Scrapy stuff:',
+      '.scrapy',
+      '',
+      '# Sphinx documentation',
+      'docs/_build/',
+      '',
+      '# PyBuilder',
+      '.pybuilder/',
+      'target/',
+      '',
+      '# Jupyter Notebook',
+      '.ipynb_checkpoints',
+      '',
+      '# IPython',
+      'profile_default/',
+      'ipython_config.py',
+      '',
+      '# pyenv',
+      '#   For a library or package, you might want to ignore these files since the code is',
+      '#   intended to run in multiple environments; otherwise, check them in:',
+      '# .python-version',
+      '',
+      '# pipenv',
+      '#   According to pypa/pipenv#598, it is recommended to include Pipfile.lock in version control.',
+      '#   However, in case of collaboration, if having platform-specific dependencies or dependencies',
+      "#   having no cross-platform support, pipenv may install dependencies that don't work, or not",
+      '#   install all needed dependencies.',
+      '#Pipfile.lock',
+      '',
+      '# PEP 582; used by e.g. github.com/David-OConnor/pyflow and github.com/pdm-project/pdm',
+      '__pypackages__/',
+      '',
+      '# Celery stuff',
+      'celerybeat-schedule',
+      'celerybeat.pid',
+      '',
+      '# SageMath parsed files',
+      '*.sage.py',
+      '',
+      '# Environments',
+      '.env',
+      '.venv',
+      '.direnv',
+      '.vscode',
+      '*.code-workspace',
+      'env/',
+      'venv/',
+      'ENV/',
+      'env.bak/',
+      'venv.bak/',
+      '',
+      '# Spyder project settings',
+      '.spyderproject',
+      '.spyproject',
+      '',
+      '# Rope project settings',
+      '.ropeproject',
+      '',
+      '# mkdocs documentation',
+      '/site',
+      '',
+      '# mypy',
+      '.mypy_cache/',
+      '.dmypy.json',
+      'dmypy.json',
+      '',
+      '# Ruff',
+      '.ruff_cache',
+      '',
+      '# Pyre type checker',
+      '.pyre/',
+      '',
+      '# pytype static type analyzer',
+      '.pytype/',
+      '',
+      '# Cython debug symbols',
+      'cython_debug/',
+      '',
+      '# OS Files to exclude',
+      'Desktop.ini',
+      'Thumbs.db',
+      'ehthumbs.db',
+      'Icon?',
+      '.DS_Store',
+      '._.DS_Store',
+      '.Spotlight-V100',
+      '.Trashes',
+      '',
+      '# AI instructive files',
+      '.agents',
+      '.agents.md',
+      'AGENTS.md',
+    ),
+    'specialParser': parseMainPyTemplate,
+    'merge': 'lines',
+  },
+)
+
+# If the bootstrap.py is run (instead of imported as a module),
+#   call the main() function:
+if __name__ == '__main__':
+  # Return the exit code to the OS.
+  raise SystemExit(main())
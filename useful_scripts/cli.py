@@ -0,0 +1,69 @@
+"""
+ Program: useful-scripts command line
+    Name: Andrew Dixon            File: cli.py
+    Date: 19 Oct 2026
+   Notes: One entry point for every script. A subcommand's module is imported only when that
+          subcommand runs, so shell hooks and cron jobs pay for nothing they do not use.
+          Keep imports here to the standard minimum; benchmarks/startup.py checks the cost.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
+
+from __future__ import annotations
+
+import sys
+import importlib
+
+PROG = 'useful-scripts'
+
+# Subcommand name -> (module path, one line summary). Modules must expose main(argv, prog).
+SUBCOMMANDS: dict[str, tuple[str, str]] = {
+  'bootstrap': ('useful_scripts.bootstrap', 'Apply embedded templates to a uv project.'),
+  'env-path': ('useful_scripts.env_path', 'Print and inspect PATH and other path lists.'),
+  'wol': ('useful_scripts.wol', 'Send Wake-on-LAN magic packets.'),
+}
+
+
+def usageText() -> str:
+  widthValue = max(len(commandName) for commandName in SUBCOMMANDS)
+  commandLines = [
+    f'  {commandName:<{widthValue}}  {summaryText}'
+    for commandName, (_, summaryText) in SUBCOMMANDS.items()
+  ]
+
+  return '\n'.join([
+    f'usage: {PROG} <command> [options]',
+    '',
+    'commands:',
+    *commandLines,
+    '',
+    f'Run "{PROG} <command> --help" for the options of a command.',
+  ])
+
+
+def main(argv: list[str] | None = None) -> int:
+  argsList: list[str] = sys.argv[1:] if argv is None else list(argv)
+
+  if not argsList or argsList[0] in ('-h', '--help'):
+    print(usageText(), file=sys.stdout if argsList else sys.stderr)
+    return 0 if argsList else 2
+
+  commandName, commandArgs = argsList[0], argsList[1:]
+  if commandName not in SUBCOMMANDS:
+    print(f'{PROG}: unknown command {commandName!r}\n\n{usageText()}', file=sys.stderr)
+    return 2
+
+  moduleObj = importlib.import_module(SUBCOMMANDS[commandName][0])
+
+  return moduleObj.main(commandArgs, prog=f'{PROG} {commandName}')
+
+
+# If the cli.py is run (instead of imported as a module),
+#   call the main() function:
+if __name__ == '__main__':
+  # Return the exit code to the OS.
+  raise SystemExit(main())
@@ -0,0 +1,53 @@
+"""
+ Program: Helpers shared by the useful-scripts subcommands
+    Name: Andrew Dixon            File: common.py
+    Date: 19 Oct 2026
+   Notes: The per-user cache location, the atomic JSON cache write, and the duration format
+          used in timing reports. Keep imports here to modules every subcommand already loads.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_NAME = 'useful-scripts'
+
+
+def cacheFilePath(fileName: str) -> Path:
+  # $XDG_CACHE_HOME/useful-scripts/<fileName>, falling back to ~/.cache as the spec says.
+  cacheRoot: str = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+
+  return Path(cacheRoot) / CACHE_DIR_NAME / fileName
+
+
+def writeJsonAtomic(filePath: str | os.PathLike[str], dataObj: Any, **dumpOptions: Any) -> None:
+  # Write to a temporary file first so a concurrent run never reads a half-written cache.
+  # OSError is left to the caller, which knows whether a lost write matters.
+  pathObj = Path(filePath)
+  pathObj.parent.mkdir(parents=True, exist_ok=True)
+  tempPath = pathObj.with_name(f'{pathObj.name}.{os.getpid()}.tmp')
+
+  try:
+    tempPath.write_text(json.dumps(dataObj, **dumpOptions), encoding='utf-8')
+    os.replace(tempPath, pathObj)
+
+  except OSError:
+    tempPath.unlink(missing_ok=True)
+    raise
+
+
+def formatNs(elapsedNs: float) -> str:
+  for unitText, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+    if elapsedNs >= scale:
+      return f'{elapsedNs / scale:.2f}{unitText}'
+
+  return f'{elapsedNs:.0f}ns'
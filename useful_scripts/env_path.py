@@ -0,0 +1,887 @@
+#! /usr/local/bin/python3
+
+"""
+ Program: Print the path of the environment in a pretty way.
+    Name: Andrew Dixon            File: env_path.py
+    Date: 11 Nov 2025
+   Notes: Also builds an index of every executable on PATH to answer "which -a" for any
+          command, to show which executables are shadowed by earlier entries, and to suggest
+          a shorter PATH that resolves every command exactly as the current one does.
+          --scan-processes reports the distinct PATH values running processes were started with.
+          --var works on any other path list (LD_LIBRARY_PATH, MANPATH, ...), and --python
+          does the same for sys.path, indexing importable modules instead of files.
+
+   Copyright (c) 2026 Andrew Dixon
+
+   This file is part of Useful_Scripts.
+   Licensed under the GNU Lesser General Public License v2.1.
+   See the LICENSE file at the project root for details.
+
+........1.........2.........3.........4.........5.........6.........7.........8.........9.........0.........1
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import stat
+import time
+import heapq
+import zipfile
+import argparse
+import subprocess
+import importlib.machinery
+from pathlib import Path
+from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from useful_scripts.common import cacheFilePath, formatNs, writeJsonAtomic
+
+
+CACHE_VERSION = 3
+
+# Longest first, so 'x.cpython-314-x86_64-linux-gnu.so' is not read as a plain '.so'.
+MODULE_SUFFIXES: tuple[str, ...] = tuple(
+  sorted(importlib.machinery.all_suffixes(), key=len, reverse=True)
+)
+
+# Which of several same-named candidates in one sys.path entry is imported.
+MODULE_KIND_RANK: dict[str, int] = {'namespace': 0, 'module': 1, 'package': 2}
+
+# Compression suffixes man(1) accepts, stripped so 'ls.1' and 'ls.1.gz' index as the same page.
+MAN_COMPRESSION_SUFFIXES: tuple[str, ...] = ('.gz', '.bz2', '.xz', '.zst', '.lzma', '.Z')
+
+# Path lists whose entries are flat directories of files, so any file name can be looked up.
+FLAT_FILE_VARIABLES: tuple[str, ...] = (
+  'LD_LIBRARY_PATH', 'DYLD_LIBRARY_PATH', 'LIBRARY_PATH', 'PKG_CONFIG_PATH',
+)
+
+DirListingType = dict[str, Any]
+CacheType = dict[str, Any]
+ExecutableIndexType = dict[str, list[str]]
+
+
+def main(argv: list[str] | None = None, prog: str | None = None) -> int:
+  parser = argparse.ArgumentParser(
+    prog=prog,
+    description='Print PATH one entry per line, or inspect the executables it resolves to.'
+  )
+  parser.add_argument(
+    '--var',
+    default='PATH',
+    metavar='NAME',
+    help=(
+      'Path-list variable to inspect (default: %(default)s). MANPATH indexes manN/ pages; '
+      'other variables index the files at the top of each entry.'
+    )
+  )
+  parser.add_argument(
+    '--python',
+    action='store_true',
+    help='Index the modules importable from sys.path and report shadowed modules and slow entries.'
+  )
+  parser.add_argument(
+    '--interpreter',
+    default=sys.executable,
+    help='Python whose sys.path --python inspects (default: %(default)s).'
+  )
+  parser.add_argument(
+    '--which',
+    nargs='+',
+    metavar='COMMAND',
+    help='Show every location of each command, in list order (like "which -a").'
+  )
+  parser.add_argument(
+    '--which-all',
+    action='store_true',
+    help='Show every location of every executable on the list.'
+  )
+  parser.add_argument(
+    '--shadowed',
+    action='store_true',
+    help='List executables hidden by a same-named executable in an earlier entry.'
+  )
+  parser.add_argument(
+    '--optimize',
+    action='store_true',
+    help='Report slow, duplicate, missing and unused entries and print an optimized list.'
+  )
+  parser.add_argument(
+    '--hot',
+    default='',
+    metavar='COMMANDS',
+    help='With --optimize, comma separated commands whose directories should come first.'
+  )
+  parser.add_argument(
+    '--sample',
+    type=int,
+    default=200,
+    help='With --optimize, commands looked up in the before/after benchmark (default: %(default)s).'
+  )
+  parser.add_argument(
+    '--scan-processes',
+    action='store_true',
+    help='Group running processes by the value of the variable they were started with.'
+  )
+  parser.add_argument(
+    '--procfs',
+    default='/proc',
+    help='procfs root read by --scan-processes (default: %(default)s).'
+  )
+  parser.add_argument(
+    '--no-cache',
+    action='store_true',
+    help='Neither read nor write the directory index cache.'
+  )
+  parser.add_argument(
+    '--refresh',
+    action='store_true',
+    help='Rescan every directory and rewrite the cache.'
+  )
+  parser.add_argument(
+    '--jobs',
+    type=int,
+    default=min(32, (os.cpu_count() or 1) + 4),
+    help='Directories scanned in parallel (default: %(default)s).'
+  )
+
+  args = parser.parse_args(argv)
+  variableName: str = args.var
+  pathText: str = os.environ.get(variableName, '')
+
+  cachePath: Path | None = None if args.no_cache else cacheFilePath('path-index.json')
+  cacheObj: CacheType = {} if cachePath is None or args.refresh else loadCache(cachePath)
+
+  if args.python:
+    pythonEntries: list[str] = getInterpreterPath(args.interpreter)
+    moduleListings = scanDirectories(pythonEntries, cacheObj, 'modules', listModules, args.jobs)
+
+    if cachePath is not None:
+      saveCache(cachePath, cacheObj, 'modules', moduleListings)
+
+    return reportPythonPath(moduleListings)
+
+  if args.scan_processes:
+    return reportProcessPaths(args.procfs, variableName, pathText, args.jobs)
+
+  if not (args.which or args.which_all or args.shadowed or args.optimize):
+    print(pathText.replace(os.pathsep, '\n'))
+    return 0
+
+  # An empty MANPATH entry splices in the system manpath rather than the current directory.
+  pathEntries: list[str] = splitPathList(pathText, '' if variableName == 'MANPATH' else '.')
+
+  # Only PATH is searched for executables. MANPATH entries hold manN/ section directories, so
+  # their pages are indexed as 'manN/page.N' and the cache is keyed on those directories too.
+  mtimeFunc: Callable[[str], int] = directoryMtime
+  if variableName == 'PATH':
+    sectionName, listFunc = 'executables', listExecutables
+  elif variableName == 'MANPATH':
+    sectionName, listFunc, mtimeFunc = 'manpages', listManPages, manTreeMtime
+  else:
+    sectionName, listFunc = 'files', listFiles
+
+  # Shadowing and reordering are only safe when the index holds everything that is looked up
+  # in an entry; for other layouts (PYTHONPATH packages, for one) the report would be wrong.
+  knownLayout = variableName in ('PATH', 'MANPATH', *FLAT_FILE_VARIABLES)
+  if (args.optimize or args.shadowed) and not knownLayout:
+    hintText = ' Use --python for PYTHONPATH.' if variableName == 'PYTHONPATH' else ''
+    parser.error(
+      f'--optimize and --shadowed support PATH, MANPATH and {", ".join(FLAT_FILE_VARIABLES)}; '
+      f'the layout of {variableName} entries is unknown.{hintText}'
+    )
+
+  # A chmod +x does not change a directory's mtime, so a cached listing can be stale. A stale
+  # --which is a nuisance, but --optimize and --shadowed would report a PATH that resolves
+  # differently; they always rescan, and the fresh listings still refresh the cache.
+  readCache: bool = not (args.optimize or args.shadowed)
+  listingsList = scanDirectories(
+    [dirPath for dirPath in pathEntries if dirPath],
+    cacheObj if readCache else {}, sectionName, listFunc, args.jobs, mtimeFunc,
+  )
+
+  if cachePath is not None:
+    saveCache(cachePath, cacheObj, sectionName, listingsList)
+
+  executableIndex: ExecutableIndexType = buildExecutableIndex(listingsList)
+
+  if args.which:
+    missingCount = 0
+    for commandName in args.which:
+      locationsList = executableIndex.get(commandName, [])
+      if not locationsList:
+        print(f'{commandName} not found')
+        missingCount += 1
+
+      for dirPath in locationsList:
+        print(os.path.join(dirPath, commandName))
+
+    return 1 if missingCount else 0
+
+  if args.optimize:
+    hotCommands: list[str] = [nameText for nameText in args.hot.split(',') if nameText]
+    return reportOptimizedPath(
+      variableName, pathEntries, listingsList, executableIndex, hotCommands, args.sample
+    )
+
+  if args.which_all:
+    for commandName in sorted(executableIndex):
+      print(f'{commandName}: {"  ".join(executableIndex[commandName])}')
+
+  if args.shadowed:
+    # Symlinked directories (/bin -> /usr/bin) "shadow" the very same file; label those.
+    realPaths: dict[str, str] = {dirPath: os.path.realpath(dirPath) for dirPath in pathEntries}
+
+    for commandName in sorted(executableIndex):
+      locationsList = executableIndex[commandName]
+      if len(locationsList) < 2:
+        continue
+
+      print(f'{commandName}: {os.path.join(locationsList[0], commandName)}')
+      for dirPath in locationsList[1:]:
+        sameText = ' (same file)' if realPaths[dirPath] == realPaths[locationsList[0]] else ''
+        print(f'  shadows {os.path.join(dirPath, commandName)}{sameText}')
+
+  return 0
+
+
+def splitPathList(pathText: str, emptyEntry: str = '.') -> list[str]:
+  # An empty entry means the current directory, as it does for the shell. MANPATH passes ''
+  # to keep its empty entries as they are.
+  return [entryText or emptyEntry for entryText in pathText.split(os.pathsep)] if pathText else []
+
+
+def loadCache(cachePath: Path) -> CacheType:
+  try:
+    cacheObj = json.loads(cachePath.read_text(encoding='utf-8'))
+  except (OSError, ValueError):
+    return {}
+
+  if not isinstance(cacheObj, dict) or cacheObj.get('version') != CACHE_VERSION:
+    return {}
+
+  return cacheObj.get('sections', {})
+
+
+def saveCache(
+  cachePath: Path, cacheObj: CacheType, sectionName: str, listingsList: list[DirListingType]
+) -> None:
+  sectionCache: CacheType = cacheObj.setdefault(sectionName, {})
+
+  changed = False
+  for listingObj in listingsList:
+    # Relative entries ('.', 'bin') depend on the working directory, so never cache them.
+    if listingObj['mtime'] is None or listingObj['fromCache'] or not os.path.isabs(listingObj['path']):
+      continue
+
+    sectionCache[listingObj['path']] = {'mtime': listingObj['mtime'], 'names': listingObj['names']}
+    changed = True
+
+  if not changed:
+    return
+
+  # The index is only a cache; a run that cannot save it is still correct.
+  try:
+    writeJsonAtomic(cachePath, {'version': CACHE_VERSION, 'sections': cacheObj})
+  except OSError:
+    pass
+
+
+def listExecutables(dirPath: str) -> list[str]:
+  executablesList: list[str] = []
+
+  with os.scandir(dirPath) as entries:
+    for entry in entries:
+      try:
+        if entry.is_file() and os.access(entry.path, os.X_OK):
+          executablesList.append(entry.name)
+
+      except OSError:
+        continue
+
+  return sorted(executablesList)
+
+
+def listFiles(dirPath: str) -> list[str]:
+  filesList: list[str] = []
+
+  with os.scandir(dirPath) as entries:
+    for entry in entries:
+      try:
+        if entry.is_file():
+          filesList.append(entry.name)
+
+      except OSError:
+        continue
+
+  return sorted(filesList)
+
+
+def listManPages(dirPath: str) -> list[str]:
+  sectionPaths: list[str] = []
+
+  with os.scandir(dirPath) as entries:
+    for entry in entries:
+      try:
+        if entry.name.startswith('man') and entry.is_dir():
+          sectionPaths.append(entry.path)
+
+      except OSError:
+        continue
+
+  pagesList: list[str] = []
+  for sectionPath in sectionPaths:
+    sectionName = os.path.basename(sectionPath)
+    try:
+      pageNames = listFiles(sectionPath)
+    except OSError:
+      continue
+
+    for pageName in pageNames:
+      for suffixText in MAN_COMPRESSION_SUFFIXES:
+        if pageName.endswith(suffixText):
+          pageName = pageName[:-len(suffixText)]
+          break
+
+      pagesList.append(f'{sectionName}/{pageName}')
+
+  return sorted(set(pagesList))
+
+
+def directoryMtime(dirPath: str) -> int:
+  return os.stat(dirPath).st_mtime_ns
+
+
+def manTreeMtime(dirPath: str) -> int:
+  # Pages live one level down, so a new page only changes its manN/ directory's mtime.
+  mtimeNs = os.stat(dirPath).st_mtime_ns
+
+  with os.scandir(dirPath) as entries:
+    for entry in entries:
+      try:
+        if entry.name.startswith('man') and entry.is_dir():
+          mtimeNs = max(mtimeNs, entry.stat().st_mtime_ns)
+
+      except OSError:
+        continue
+
+  return mtimeNs
+
+
+def scanDirectory(
+  dirPath: str,
+  sectionCache: CacheType,
+  listFunc: Callable[[str], list[Any]],
+  mtimeFunc: Callable[[str], int] = directoryMtime,
+) -> DirListingType:
+  listingObj: DirListingType = {'path': dirPath, 'mtime': None, 'names': [], 'fromCache': False}
+
+  # The directory mtime changes whenever an entry is added, removed or renamed, so an
+  # unchanged mtime means the cached listing is still current.
+  try:
+    mtimeNs = mtimeFunc(dirPath)
+  except OSError:
+    return listingObj
+
+  cachedObj = sectionCache.get(dirPath)
+  if cachedObj and cachedObj.get('mtime') == mtimeNs:
+    listingObj.update(mtime=mtimeNs, names=cachedObj['names'], fromCache=True)
+    return listingObj
+
+  try:
+    listingObj['names'] = listFunc(dirPath)
+  except (OSError, zipfile.BadZipFile):
+    return listingObj
+
+  listingObj['mtime'] = mtimeNs
+
+  return listingObj
+
+
+def scanDirectories(
+  pathEntries: list[str],
+  cacheObj: CacheType,
+  sectionName: str,
+  listFunc: Callable[[str], list[Any]],
+  jobs: int,
+  mtimeFunc: Callable[[str], int] = directoryMtime,
+) -> list[DirListingType]:
+  # Each directory costs one stat plus, on a cache miss, one scandir. Running them side by
+  # side hides the latency of slow network mounts instead of paying it once per entry.
+  uniquePaths: list[str] = list(dict.fromkeys(pathEntries))
+  sectionCache: CacheType = cacheObj.get(sectionName, {})
+
+  with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+    listingsIter = pool.map(
+      lambda dirPath: scanDirectory(dirPath, sectionCache, listFunc, mtimeFunc), uniquePaths
+    )
+    listingsByPath = dict(zip(uniquePaths, listingsIter, strict=True))
+
+  return [listingsByPath[dirPath] for dirPath in pathEntries]
+
+
+def buildExecutableIndex(listingsList: list[DirListingType]) -> ExecutableIndexType:
+  # Map every executable name to the directories providing it, in PATH order.
+  executableIndex: ExecutableIndexType = {}
+  seenPaths: set[str] = set()
+
+  for listingObj in listingsList:
+    if listingObj['path'] in seenPaths:
+      continue
+
+    seenPaths.add(listingObj['path'])
+    for commandName in listingObj['names']:
+      executableIndex.setdefault(commandName, []).append(listingObj['path'])
+
+  return executableIndex
+
+
+def timeStat(pathText: str, repeats: int = 3) -> tuple[int, str]:
+  # Best of a few samples, so one scheduler hiccup does not mark a fast entry as slow.
+  bestNs: int = 0
+  kindText: str = 'missing'
+
+  for _ in range(repeats):
+    startNs = time.perf_counter_ns()
+    try:
+      statResult = os.stat(pathText)
+      kindText = 'dir' if stat.S_ISDIR(statResult.st_mode) else 'not a directory'
+    except FileNotFoundError:
+      kindText = 'missing'
+    except OSError:
+      kindText = 'unreadable'
+
+    elapsedNs = time.perf_counter_ns() - startNs
+    bestNs = elapsedNs if not bestNs else min(bestNs, elapsedNs)
+
+  return bestNs, kindText
+
+
+def analyzePathEntries(
+  pathEntries: list[str],
+  executableIndex: ExecutableIndexType,
+  hotCommands: list[str],
+  indexedPaths: set[str] | None = None,
+) -> list[DirListingType]:
+  winsByPath: dict[str, int] = {}
+  hotByPath: dict[str, int] = {}
+
+  for locationsList in executableIndex.values():
+    winsByPath[locationsList[0]] = winsByPath.get(locationsList[0], 0) + 1
+
+  for commandName in hotCommands:
+    if commandName in executableIndex:
+      winnerPath = executableIndex[commandName][0]
+      hotByPath[winnerPath] = hotByPath.get(winnerPath, 0) + 1
+
+  firstIndex: dict[str, int] = {}
+  entriesList: list[DirListingType] = []
+
+  for index, dirPath in enumerate(pathEntries):
+    statNs, kindText = timeStat(dirPath)
+    entryObj: DirListingType = {
+      'index': index,
+      'path': dirPath,
+      'statNs': statNs,
+      'kind': kindText,
+      'wins': winsByPath.get(dirPath, 0),
+      'hot': hotByPath.get(dirPath, 0),
+      'duplicateOf': firstIndex.get(dirPath),
+      'relative': not os.path.isabs(dirPath),
+      'indexed': indexedPaths is None or dirPath in indexedPaths,
+    }
+
+    firstIndex.setdefault(dirPath, index)
+
+    if not dirPath:
+      # An empty MANPATH entry is where man inserts the system manpath; it is not a directory,
+      # but it stays, and as a relative entry nothing is moved across it.
+      entryObj['problem'] = ''
+    elif entryObj['duplicateOf'] is not None:
+      entryObj['problem'] = f'duplicate of #{entryObj["duplicateOf"]}'
+    elif kindText != 'dir':
+      entryObj['problem'] = kindText
+    elif not entryObj['wins'] and not entryObj['relative'] and entryObj['indexed']:
+      entryObj['problem'] = 'never the first hit'
+    else:
+      entryObj['problem'] = ''
+
+    entriesList.append(entryObj)
+
+  return entriesList
+
+
+def optimizePathEntries(
+  entriesList: list[DirListingType], executableIndex: ExecutableIndexType
+) -> list[str]:
+  # Dropped entries never provide the first hit for any command, so removing them cannot
+  # change what a lookup resolves to. Relative entries depend on the working directory, and
+  # entries that could not be listed may shadow anything; they stay where they are and
+  # nothing is moved across them.
+  keptList: list[DirListingType] = [entryObj for entryObj in entriesList if not entryObj['problem']]
+
+  segmentsList: list[list[DirListingType]] = [[]]
+  for entryObj in keptList:
+    if entryObj['relative'] or not entryObj['indexed']:
+      segmentsList.append([entryObj])
+      segmentsList.append([])
+    else:
+      segmentsList[-1].append(entryObj)
+
+  optimizedList: list[str] = []
+  for segmentList in segmentsList:
+    optimizedList.extend(reorderSegment(segmentList, executableIndex))
+
+  return optimizedList
+
+
+def reorderSegment(
+  segmentList: list[DirListingType], executableIndex: ExecutableIndexType
+) -> list[str]:
+  if len(segmentList) < 2:
+    return [entryObj['path'] for entryObj in segmentList]
+
+  # A directory may only move ahead of another if it does not shadow anything that the
+  # other one currently wins. Build those "must stay before" edges, then topologically sort,
+  # always taking the hottest available directory next.
+  entryByPath: dict[str, DirListingType] = {entryObj['path']: entryObj for entryObj in segmentList}
+  successorsMap: dict[str, set[str]] = {dirPath: set() for dirPath in entryByPath}
+  inDegree: dict[str, int] = dict.fromkeys(entryByPath, 0)
+
+  for locationsList in executableIndex.values():
+    if len(locationsList) < 2 or locationsList[0] not in entryByPath:
+      continue
+
+    winnerPath = locationsList[0]
+    for otherPath in locationsList[1:]:
+      if otherPath in entryByPath and otherPath not in successorsMap[winnerPath]:
+        successorsMap[winnerPath].add(otherPath)
+        inDegree[otherPath] += 1
+
+  def priority(dirPath: str) -> tuple[int, int, int, str]:
+    entryObj = entryByPath[dirPath]
+    return (-entryObj['hot'], -entryObj['wins'], entryObj['index'], dirPath)
+
+  readyHeap = [priority(dirPath) for dirPath, degree in inDegree.items() if degree == 0]
+  heapq.heapify(readyHeap)
+
+  orderedList: list[str] = []
+  while readyHeap:
+    dirPath = heapq.heappop(readyHeap)[-1]
+    orderedList.append(dirPath)
+
+    for nextPath in successorsMap[dirPath]:
+      inDegree[nextPath] -= 1
+      if not inDegree[nextPath]:
+        heapq.heappush(readyHeap, priority(nextPath))
+
+  return orderedList
+
+
+def benchmarkLookups(pathEntries: list[str], commandsList: list[str], repeats: int = 3) -> int:
+  # Resolve each command the way a shell does on a hash miss: stat dir/command in PATH
+  # order until one exists. Returns the best total time over a few rounds.
+  bestNs: int = 0
+
+  for _ in range(repeats):
+    startNs = time.perf_counter_ns()
+
+    for commandName in commandsList:
+      for dirPath in pathEntries:
+        if not dirPath:
+          continue
+
+        try:
+          os.stat(os.path.join(dirPath, commandName))
+          break
+        except OSError:
+          continue
+
+    elapsedNs = time.perf_counter_ns() - startNs
+    bestNs = elapsedNs if not bestNs else min(bestNs, elapsedNs)
+
+  return bestNs
+
+
+def reportOptimizedPath(
+  variableName: str,
+  pathEntries: list[str],
+  listingsList: list[DirListingType],
+  executableIndex: ExecutableIndexType,
+  hotCommands: list[str],
+  sampleSize: int,
+) -> int:
+  indexedPaths: set[str] = {
+    listingObj['path'] for listingObj in listingsList if listingObj['mtime'] is not None
+  }
+  entriesList = analyzePathEntries(pathEntries, executableIndex, hotCommands, indexedPaths)
+
+  print(f'{"#":>3}  {"stat":>9}  {"wins":>5}  entry')
+  for entryObj in entriesList:
+    problemText = f'  <- {entryObj["problem"]}' if entryObj['problem'] else ''
+    if not entryObj['path']:
+      problemText = '(system manpath)  <- kept in place'
+    elif not problemText and not entryObj['indexed']:
+      problemText = '  <- could not be listed, kept in place'
+    print(
+      f'{entryObj["index"]:>3}  {formatNs(entryObj["statNs"]):>9}  {entryObj["wins"]:>5}  '
+      f'{entryObj["path"]}{problemText}'
+    )
+
+  optimizedEntries = optimizePathEntries(entriesList, executableIndex)
+
+  # Commands spread evenly over the index, plus one that does not exist: a miss walks
+  # every entry, which is what long PATHs cost most.
+  commandNames = sorted(executableIndex)
+  stepSize = max(1, len(commandNames) // max(1, sampleSize))
+  commandsList = commandNames[::stepSize][:sampleSize] + ['__no_such_command__']
+
+  beforeNs = benchmarkLookups(pathEntries, commandsList)
+  afterNs = benchmarkLookups(optimizedEntries, commandsList)
+
+  droppedCount = len(pathEntries) - len(optimizedEntries)
+  gainText = f'{100 * (beforeNs - afterNs) / beforeNs:.0f}%' if beforeNs else 'n/a'
+
+  print(f'\nEntries: {len(pathEntries)} -> {len(optimizedEntries)} ({droppedCount} dropped)')
+  print(
+    f'Lookup of {len(commandsList)} command(s): {formatNs(beforeNs)} -> {formatNs(afterNs)} '
+    f'({gainText} faster)'
+  )
+  print('Every command resolves to the same file as before (as of this scan).\n')
+  print(f"export {variableName}='{os.pathsep.join(optimizedEntries)}'")
+
+  return 0
+
+
+def extractVariable(environBlob: bytes, variableKey: bytes) -> bytes | None:
+  # environ is NUL separated NAME=value pairs; slice the one value out without decoding
+  # the rest of the environment.
+  if environBlob.startswith(variableKey):
+    startIndex = len(variableKey)
+  else:
+    foundIndex = environBlob.find(b'\0' + variableKey)
+    if foundIndex < 0:
+      return None
+
+    startIndex = foundIndex + 1 + len(variableKey)
+
+  endIndex = environBlob.find(b'\0', startIndex)
+
+  return environBlob[startIndex:] if endIndex < 0 else environBlob[startIndex:endIndex]
+
+
+def readProcessVariable(processDir: str, variableKey: bytes) -> tuple[str, bytes | None, str]:
+  # Processes can exit between listing procfs and reading them; report that rather than fail.
+  try:
+    with open(os.path.join(processDir, 'environ'), 'rb') as environFile:
+      valueBytes = extractVariable(environFile.read(), variableKey)
+
+  except FileNotFoundError:
+    return 'exited', None, ''
+
+  except ProcessLookupError:
+    # Kernel threads have no user environment; their environ reads fail the same way.
+    return ('kernel' if os.path.isdir(processDir) else 'exited'), None, ''
+
+  except PermissionError:
+    return 'denied', None, ''
+
+  except OSError:
+    return 'exited', None, ''
+
+  try:
+    with open(os.path.join(processDir, 'comm'), 'rb') as commFile:
+      commandName = commFile.read().strip().decode('utf-8', 'replace')
+
+  except OSError:
+    commandName = ''
+
+  return ('ok' if valueBytes is not None else 'unset'), valueBytes, commandName
+
+
+def scanProcessVariable(procfsRoot: str, variableName: str, jobs: int) -> dict[str, Any]:
+  variableKey: bytes = variableName.encode() + b'='
+
+  try:
+    processDirs: list[str] = [
+      entry.path for entry in os.scandir(procfsRoot) if entry.name.isdigit()
+    ]
+  except OSError as errorObj:
+    raise SystemExit(f'Cannot read {procfsRoot}: {errorObj}') from errorObj
+
+  # Identical values share one bucket, so thousands of processes collapse to a handful of
+  # variants without keeping a copy of every environment.
+  variantsMap: dict[bytes, dict[str, Any]] = {}
+  countsMap: dict[str, int] = {'ok': 0, 'unset': 0, 'kernel': 0, 'denied': 0, 'exited': 0}
+
+  with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+    resultsIter = pool.map(
+      lambda processDir: readProcessVariable(processDir, variableKey), processDirs
+    )
+
+    for processDir, (statusText, valueBytes, commandName) in zip(processDirs, resultsIter, strict=True):
+      countsMap[statusText] += 1
+      if valueBytes is None:
+        continue
+
+      variantObj = variantsMap.setdefault(valueBytes, {'pids': [], 'commands': {}})
+      variantObj['pids'].append(int(os.path.basename(processDir)))
+      if commandName:
+        variantObj['commands'][commandName] = variantObj['commands'].get(commandName, 0) + 1
+
+  return {'total': len(processDirs), 'counts': countsMap, 'variants': variantsMap}
+
+
+def reportProcessPaths(procfsRoot: str, variableName: str, currentText: str, jobs: int) -> int:
+  scanObj = scanProcessVariable(procfsRoot, variableName, jobs)
+  countsMap: dict[str, int] = scanObj['counts']
+  variantsMap: dict[bytes, dict[str, Any]] = scanObj['variants']
+
+  print(
+    f'Scanned {scanObj["total"]} process(es): {len(variantsMap)} distinct {variableName} '
+    f'value(s), {countsMap["unset"]} without {variableName}, {countsMap["kernel"]} kernel thread(s), '
+    f'{countsMap["denied"]} permission denied, {countsMap["exited"]} exited during the scan.'
+  )
+
+  rankedList = sorted(variantsMap.items(), key=lambda item: (-len(item[1]['pids']), item[0]))
+  for valueBytes, variantObj in rankedList:
+    valueText = valueBytes.decode('utf-8', 'replace')
+    commandsMap: dict[str, int] = variantObj['commands']
+    topCommands = sorted(commandsMap, key=lambda nameText: (-commandsMap[nameText], nameText))
+    moreText = f', +{len(topCommands) - 5} more' if len(topCommands) > 5 else ''
+    currentMark = '  (same as this shell)' if valueText == currentText else ''
+
+    commandsText = ', '.join(topCommands[:5]) + moreText
+    print(f'\n{len(variantObj["pids"]):>6} process(es){currentMark}: {commandsText}')
+    for entryText in valueText.split(os.pathsep):
+      print(f'         {entryText}')
+
+  return 0
+
+
+def getInterpreterPath(interpreterPath: str) -> list[str]:
+  # Ask the interpreter itself, so PYTHONPATH, .pth files and site-packages are all applied.
+  # The leading '' is the working directory, as for "python -c" and "python -m".
+  resultObj = subprocess.run(
+    [interpreterPath, '-c', 'import json, sys; print(json.dumps(sys.path))'],
+    stdout=subprocess.PIPE, text=True, check=False,
+  )
+
+  if resultObj.returncode != 0:
+    raise SystemExit(f'Could not read sys.path from {interpreterPath}')
+
+  return [entryText or '.' for entryText in json.loads(resultObj.stdout)]
+
+
+def moduleKind(fileName: str, isDir: bool, hasInit: bool) -> tuple[str, str] | None:
+  if isDir:
+    if not fileName.isidentifier() or fileName == '__pycache__':
+      return None
+
+    return fileName, 'package' if hasInit else 'namespace'
+
+  for suffixText in MODULE_SUFFIXES:
+    if fileName.endswith(suffixText):
+      moduleName = fileName[: -len(suffixText)]
+      if moduleName.isidentifier():
+        return moduleName, 'module'
+
+  return None
+
+
+def listModules(entryPath: str) -> list[list[str]]:
+  # Top-level importable names in one sys.path entry, as [name, kind] pairs. Within one entry
+  # the import system takes a package over a module, and a module over a namespace portion,
+  # whatever order the directory lists them in.
+  modulesMap: dict[str, str] = {}
+
+  def addModule(found: tuple[str, str] | None) -> None:
+    if found and MODULE_KIND_RANK[found[1]] > MODULE_KIND_RANK.get(modulesMap.get(found[0], ''), -1):
+      modulesMap[found[0]] = found[1]
+
+  if os.path.isdir(entryPath):
+    with os.scandir(entryPath) as entries:
+      for entry in entries:
+        try:
+          isDir = entry.is_dir()
+          hasInit = isDir and any(
+            os.path.exists(os.path.join(entry.path, '__init__' + suffixText))
+            for suffixText in ('.py', '.pyc')
+          )
+        except OSError:
+          continue
+
+        addModule(moduleKind(entry.name, isDir, hasInit))
+
+  else:
+    with zipfile.ZipFile(entryPath) as zipObj:
+      zipNames: set[str] = set(zipObj.namelist())
+
+    for nameText in zipNames:
+      topName, _, restText = nameText.partition('/')
+      if not restText:
+        addModule(moduleKind(topName, False, False))
+      else:
+        hasInit = any(f'{topName}/__init__{suffixText}' in zipNames for suffixText in ('.py', '.pyc'))
+        addModule(moduleKind(topName, True, hasInit))
+
+  return sorted([nameText, kindText] for nameText, kindText in modulesMap.items())
+
+
+def reportPythonPath(listingsList: list[DirListingType]) -> int:
+  print(f'{"#":>3}  {"stat":>9}  {"modules":>7}  entry')
+
+  locationsMap: dict[str, list[tuple[str, str]]] = {}
+  seenPaths: set[str] = set()
+
+  for index, listingObj in enumerate(listingsList):
+    entryPath: str = listingObj['path']
+    statNs, kindText = timeStat(entryPath)
+
+    # Zip archives are not directories but are importable; anything else unlisted is dead.
+    if entryPath in seenPaths:
+      problemText = 'duplicate'
+    elif kindText != 'dir' and listingObj['mtime'] is None:
+      problemText = kindText
+    else:
+      problemText = ''
+
+    problemText = f'  <- {problemText}' if problemText else ''
+    print(f'{index:>3}  {formatNs(statNs):>9}  {len(listingObj["names"]):>7}  {entryPath}{problemText}')
+
+    if entryPath in seenPaths:
+      continue
+
+    seenPaths.add(entryPath)
+    for nameText, moduleType in listingObj['names']:
+      locationsMap.setdefault(nameText, []).append((entryPath, moduleType))
+
+  # Namespace package portions only merge when no entry has a regular module or package of
+  # that name; otherwise the first regular one wins and hides everything else.
+  print('\nShadowed modules:')
+  shadowedCount = 0
+
+  for nameText in sorted(locationsMap):
+    locationsList = locationsMap[nameText]
+    regularList = [location for location in locationsList if location[1] != 'namespace']
+    if not regularList or len(locationsList) < 2:
+      continue
+
+    shadowedCount += 1
+    print(f'{nameText}: {regularList[0][0]} ({regularList[0][1]})')
+    for entryPath, moduleType in locationsList:
+      if (entryPath, moduleType) != regularList[0]:
+        print(f'  shadows {entryPath} ({moduleType})')
+
+  if not shadowedCount:
+    print('  none')
+
+  return 0
+
+
+# If the env_path.py is run (instead of imported as a module),
+#   call the main() function:
+if __name__ == '__main__':
+  # Return the exit code to the OS.
+  raise SystemExit(main())
@@ -0,0 +1,1098 @@
+#!/usr/bin/env python3
+
+"""
+ Program: Wake PC from LAN
+    Name: Andrew Dixon            File: wol.py
+    Date: 11 Nov 2025
+   Notes: Targets are routed to the local interface that sits on their subnet and sent
+          concurrently, one bound socket per interface. Hosts can be woken by name or IP address
+          from a cache learned from the neighbor table and DHCP leases.
+
+  Copyright (c) 2026 Andrew Dixon
+
+  This file is part of Useful_Scripts.
+  Licensed under the GNU Lesser General Public License v2.1.
+  See the LICENSE file at the project root for details.
+........1.........2.........3.........4.........5.........6.........7.........8.........9.........0.........1
+"""
+
+import os
+import re
+import json
+import time
+import heapq
+import socket
+import string
+import struct
+import argparse
+import datetime
+import itertools
+import ipaddress
+import subprocess
+from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from useful_scripts.common import cacheFilePath, formatNs, writeJsonAtomic
+
+# Sent to for targets without a subnet, unless --broadcast or the caller says otherwise.
+BROADCAST = '255.255.255.255'
+
+WOL_PORT = 7
+
+# Linux ioctl request numbers used to read an interface's IPv4 configuration.
+SIOCGIFADDR = 0x8915
+SIOCGIFBRDADDR = 0x8919
+SIOCGIFNETMASK = 0x891B
+SO_BINDTODEVICE = getattr(socket, 'SO_BINDTODEVICE', 25)
+
+# Host cache sources. Lease files that do not exist are skipped, so listing both servers is safe.
+ARP_TABLE = '/proc/net/arp'
+LEASE_FILES = (
+  '/var/lib/dhcp/dhcpd.leases',         # ISC dhcpd
+  '/var/lib/misc/dnsmasq.leases',       # dnsmasq (Debian, OpenWrt)
+  '/var/lib/dnsmasq/dnsmasq.leases',    # dnsmasq (Fedora)
+)
+NEIGHBOR_CACHE_VERSION = 1
+ATF_COM = 0x2                           # /proc/net/arp flag: the entry has a hardware address
+
+# One "lease <ip> { ... }" block of an ISC dhcpd.leases file; the closing brace is in column 0.
+# The newline after it is part of the block, so a fully read file ends at its own size.
+ISC_LEASE = re.compile(rb'^lease\s+([0-9.]+)\s*\{(.*?)^\}\n?', re.MULTILINE | re.DOTALL)
+ISC_LEASE_FIELDS = re.compile(
+  rb'^\s*(hardware ethernet|client-hostname|cltt|starts)\s+(.*?);', re.MULTILINE
+)
+
+# Known machines as (MAC address, subnet) pairs. The subnet picks the interface the packet
+# leaves on, so multi-homed hosts reach each target on the right segment.
+InventoryType = tuple[tuple[str, str | None], ...]
+InterfaceType = dict[str, Any]
+TargetType = dict[str, Any]
+RouteType = tuple[InterfaceType | None, list[TargetType]]
+StatsType = dict[str, list[int]]
+PlanType = dict[str, Any]
+EventQueueType = list[tuple[float, int, Callable[[], None]]]
+SocketCacheType = dict[str | None, socket.socket]
+NeighborType = dict[str, Any]
+NeighborCacheType = dict[str, Any]
+
+# Tie-breaker so events due at the same instant run in the order they were scheduled.
+_EVENT_SEQUENCE = itertools.count()
+
+
+def main(
+  argv: list[str] | None = None,
+  prog: str | None = None,
+  inventory: InventoryType = (),
+  broadcast: str = BROADCAST,
+) -> int:
+  parser = argparse.ArgumentParser(prog=prog, description='Send Wake-on-LAN magic packets.')
+  parser.add_argument(
+    'targets',
+    nargs='*',
+    metavar='HOST[@SUBNET]',
+    help=(
+      'Machines to wake, by MAC address or by a hostname or IP address in the host cache. '
+      'Defaults to the inventory passed in by the calling script.'
+    )
+  )
+  parser.add_argument(
+    '--broadcast',
+    default=broadcast,
+    help='Broadcast address for targets without a subnet (default: %(default)s).'
+  )
+  parser.add_argument(
+    '--list-interfaces',
+    action='store_true',
+    help='Show the local interfaces and broadcast addresses that targets can be routed to.'
+  )
+  parser.add_argument(
+    '--stats',
+    action='store_true',
+    help='Print timing for the resolve, build and send phases.'
+  )
+  parser.add_argument(
+    '--plan',
+    metavar='FILE',
+    help='Run a staged JSON wake plan instead of waking targets immediately.'
+  )
+  parser.add_argument(
+    '--dry-run',
+    '--dryrun',
+    action='store_true',
+    help='With --plan, print the schedule on a simulated clock without sending or probing.'
+  )
+  parser.add_argument(
+    '--refresh',
+    action='store_true',
+    help='Learn MAC addresses from the neighbor table and DHCP leases into the host cache.'
+  )
+  parser.add_argument(
+    '--hosts',
+    action='store_true',
+    help='List the hosts in the host cache.'
+  )
+  parser.add_argument(
+    '--host-cache',
+    metavar='FILE',
+    default=str(cacheFilePath('neighbors.json')),
+    help='Host cache file (default: %(default)s).'
+  )
+  parser.add_argument(
+    '--arp-file',
+    action='append',
+    metavar='FILE',
+    help='Read this file in /proc/net/arp format. Repeatable.'
+  )
+  parser.add_argument(
+    '--neigh-file',
+    action='append',
+    metavar='FILE',
+    help='Read saved "ip neigh" output instead of running ip. Repeatable.'
+  )
+  parser.add_argument(
+    '--lease-file',
+    action='append',
+    metavar='FILE',
+    help=(
+      'Read this ISC dhcpd or dnsmasq lease file. Repeatable. When any of --arp-file, '
+      '--neigh-file or --lease-file is given, only the files given are read.'
+    )
+  )
+  parser.add_argument(
+    '--bench',
+    action='store_true',
+    help='Benchmark building and sending packets to a loopback UDP sink; nothing is woken.'
+  )
+  parser.add_argument(
+    '--bench-sizes',
+    default='1,1000,100000',
+    help='Comma separated target counts for --bench (default: %(default)s).'
+  )
+
+  args = parser.parse_args(argv)
+
+  if args.dry_run and not args.plan:
+    parser.error('--dry-run only applies to --plan; without it packets would really be sent')
+
+  if args.bench:
+    run_benchmark([int(size) for size in args.bench_sizes.split(',')])
+    return 0
+
+  stats: StatsType | None = {} if args.stats else None
+
+  start_ns = time.perf_counter_ns()
+  interfaces = enumerate_interfaces()
+
+  if args.plan:
+    plan = load_plan(args.plan, args.broadcast)
+    return run_plan(plan, interfaces, dry_run=bool(args.dry_run))
+
+  if args.list_interfaces:
+    for iface in interfaces:
+      print(f'{iface["name"]:<16} {iface["address"]:<16} {iface["network"]} -> {iface["broadcast"]}')
+    return 0
+
+  # The host cache is only read when a name has to be looked up; MAC-only runs skip the file.
+  needs_cache = args.refresh or args.hosts or any(not is_mac(text.partition('@')[0]) for text in args.targets)
+  cache: NeighborCacheType = load_neighbor_cache(args.host_cache) if needs_cache else new_neighbor_cache()
+  fixture_given = bool(args.arp_file or args.neigh_file or args.lease_file)
+
+  def refresh() -> None:
+    refresh_start_ns = time.perf_counter_ns()
+    counts = refresh_neighbors(
+      cache,
+      interfaces,
+      arp_files=args.arp_file or ([] if fixture_given else [ARP_TABLE]),
+      neigh_files=args.neigh_file or [],
+      lease_files=args.lease_file or ([] if fixture_given else list(LEASE_FILES)),
+      live_neigh=not fixture_given,
+    )
+    save_neighbor_cache(args.host_cache, cache)
+    print(
+      f'Host cache {args.host_cache}: {counts["read"]} source(s) read, {counts["unchanged"]} '
+      f'unchanged, {counts["missing"]} missing; {counts["entries"]} entries, {counts["added"]} '
+      f'new host(s), {counts["updated"]} updated '
+      f'({formatNs(time.perf_counter_ns() - refresh_start_ns)}).'
+    )
+
+  if args.refresh:
+    refresh()
+
+  if args.hosts:
+    print_hosts(cache)
+
+  if (args.refresh or args.hosts) and not args.targets:
+    return 0
+
+  if args.targets:
+    targets: list[TargetType] = []
+    for text in args.targets:
+      try:
+        targets.append(resolve_target(text, args.broadcast, cache, refresh))
+      except ValueError as error:
+        parser.error(f'invalid target {text!r}: {error}')
+  elif inventory:
+    targets = [make_target(mac, subnet, args.broadcast) for mac, subnet in inventory]
+  else:
+    parser.error('no targets given')
+
+  routes = route_targets(targets, interfaces)
+  record_sample(stats, 'resolve', time.perf_counter_ns() - start_ns)
+
+  for iface, routed in routes:
+    via = f'{iface["name"]} ({iface["address"]})' if iface else 'default route'
+    for target in routed:
+      label = f'{target["name"]} ({target["mac"]})' if target.get('name') else target['mac']
+      print(f'Routing {label} to {target["broadcast"]} via {via}')
+
+  build_packets(targets, stats)
+  sent = send_routes(routes, stats)
+  print(f'\nWoL packets sent to {sent} of {len(targets)} system(s).\n')
+
+  if stats is not None:
+    print_stats(stats)
+
+  return 0 if sent == len(targets) else 1
+
+
+def mac_to_hex(mac: str) -> str:
+  hex_text = ''.join(ch for ch in mac if ch not in ':-.')
+  if len(hex_text) != 12 or not all(ch in string.hexdigits for ch in hex_text):
+    raise ValueError(f'Not a MAC address: {mac!r}')
+
+  return hex_text
+
+
+def is_mac(text: str) -> bool:
+  try:
+    normalize_mac(text)
+  except ValueError:
+    return False
+
+  return True
+
+
+def normalize_mac(mac: str) -> str:
+  ''' Lower case, colon separated form used as the host cache key '''
+  return bytes.fromhex(mac_to_hex(mac)).hex(':')
+
+
+def build_packet(mac: str) -> bytes:
+  return b'\xff' * 6 + bytes.fromhex(mac_to_hex(mac)) * 20
+
+
+def build_packet_concat(mac: str) -> bytes:
+  ''' Original byte-at-a-time builder, kept as the baseline for --bench '''
+  data = ''.join(['FFFFFFFFFFFF', mac_to_hex(mac) * 20])
+  send_data = b''
+
+  for i in range(0, len(data), 2):
+    send_data = b''.join([send_data, struct.pack('B', int(data[i: i + 2], 16))])
+
+  return send_data
+
+
+def make_target(mac: str, subnet: str | None, broadcast: str = BROADCAST) -> TargetType:
+  ''' A subnet's directed broadcast is used even when no local interface is on that subnet '''
+  network = ipaddress.IPv4Network(subnet, strict=False) if subnet else None
+  broadcast = str(network.broadcast_address) if network else broadcast
+
+  return {'mac': mac, 'network': network, 'broadcast': broadcast}
+
+
+def parse_target(text: str, broadcast: str = BROADCAST) -> TargetType:
+  mac, _, subnet = text.partition('@')
+  return make_target(mac, subnet or None, broadcast)
+
+
+def _interface_ioctl(sock: socket.socket, request: int, name: str) -> str:
+  import fcntl
+
+  ifreq = struct.pack('256s', name[:15].encode())
+  result = fcntl.ioctl(sock.fileno(), request, ifreq)
+
+  return socket.inet_ntoa(result[20:24])
+
+
+def enumerate_interfaces() -> list[InterfaceType]:
+  ''' Return the IPv4 interfaces that can carry broadcasts (loopback excluded) '''
+  interfaces: list[InterfaceType] = []
+
+  try:
+    names = [name for _, name in socket.if_nameindex()]
+  except OSError:
+    return interfaces
+
+  with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+    for name in names:
+      try:
+        address = _interface_ioctl(sock, SIOCGIFADDR, name)
+        netmask = _interface_ioctl(sock, SIOCGIFNETMASK, name)
+      except (ImportError, OSError):
+        continue
+
+      network = ipaddress.IPv4Interface(f'{address}/{netmask}').network
+      if network.is_loopback:
+        continue
+
+      try:
+        broadcast = _interface_ioctl(sock, SIOCGIFBRDADDR, name)
+      except OSError:
+        broadcast = str(network.broadcast_address)
+
+      interfaces.append(
+        {'name': name, 'address': address, 'network': network, 'broadcast': broadcast}
+      )
+
+  return interfaces
+
+
+def route_targets(targets: list[TargetType], interfaces: list[InterfaceType]) -> list[RouteType]:
+  ''' Group targets by the interface whose network overlaps the target subnet '''
+  routes: dict[str | None, list[TargetType]] = {}
+  by_name: dict[str | None, InterfaceType] = {iface['name']: iface for iface in interfaces}
+
+  for target in targets:
+    match = None
+
+    if target['network'] is not None:
+      for iface in interfaces:
+        if iface['network'].overlaps(target['network']):
+          match = iface['name']
+          break
+
+    routes.setdefault(match, []).append(target)
+
+  return [(by_name.get(name), routed) for name, routed in routes.items()]
+
+
+def open_socket(iface: InterfaceType | None) -> socket.socket:
+  sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+  sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+  if iface is None:
+    return sock
+
+  # Binding to the device needs CAP_NET_RAW; binding to the interface address works everywhere.
+  try:
+    sock.setsockopt(socket.SOL_SOCKET, SO_BINDTODEVICE, iface['name'].encode())
+  except OSError:
+    sock.bind((iface['address'], 0))
+
+  return sock
+
+
+def get_socket(sockets: SocketCacheType, iface: InterfaceType | None) -> socket.socket:
+  ''' The bound socket for an interface (None: default route), opened on first use '''
+  key = iface['name'] if iface else None
+  if key not in sockets:
+    sockets[key] = open_socket(iface)
+
+  return sockets[key]
+
+
+def close_sockets(sockets: SocketCacheType) -> None:
+  for sock in sockets.values():
+    sock.close()
+
+  sockets.clear()
+
+
+def build_packets(targets: list[TargetType], stats: StatsType | None = None) -> None:
+  for target in targets:
+    start_ns = time.perf_counter_ns()
+    target['packet'] = build_packet(target['mac'])
+    record_sample(stats, 'build', time.perf_counter_ns() - start_ns)
+
+
+def send_packets(
+  sock: socket.socket,
+  targets: list[TargetType],
+  stats: StatsType | None = None,
+  address: tuple[str, int] | None = None,
+) -> int:
+  ''' Send pre-built packets; address overrides each target's broadcast address '''
+  sent = 0
+  samples: list[int] = []
+
+  for target in targets:
+    start_ns = time.perf_counter_ns()
+
+    try:
+      sock.sendto(target['packet'], address or (target['broadcast'], WOL_PORT))
+    except OSError as err:
+      print(f'Failed to wake {target["mac"]}: {err}')
+      continue
+
+    samples.append(time.perf_counter_ns() - start_ns)
+    sent += 1
+
+  if stats is not None:
+    stats.setdefault('send', []).extend(samples)
+
+  return sent
+
+
+def send_routes(
+  routes: list[RouteType],
+  stats: StatsType | None = None,
+  sockets: SocketCacheType | None = None,
+  pool: ThreadPoolExecutor | None = None,
+) -> int:
+  ''' Send already-built targets on their routed interface, one worker per interface
+
+  Callers that send repeatedly (wake plans) pass their own socket cache and pool so each
+  interface is bound once; otherwise both are created for this call and torn down after it.
+  '''
+  if not routes:
+    return 0
+
+  owned_sockets: SocketCacheType = {} if sockets is None else sockets
+  route_sockets = [get_socket(owned_sockets, iface) for iface, _ in routes]
+  route_targets_list = [routed for _, routed in routes]
+
+  try:
+    if pool is not None:
+      return sum(pool.map(send_packets, route_sockets, route_targets_list, [stats] * len(routes)))
+
+    with ThreadPoolExecutor(max_workers=len(routes)) as own_pool:
+      return sum(own_pool.map(send_packets, route_sockets, route_targets_list, [stats] * len(routes)))
+
+  finally:
+    if sockets is None:
+      close_sockets(owned_sockets)
+
+
+def send_targets(targets: list[TargetType], interfaces: list[InterfaceType]) -> int:
+  build_packets(targets)
+  return send_routes(route_targets(targets, interfaces))
+
+
+def record_sample(stats: StatsType | None, phase: str, elapsed_ns: int) -> None:
+  if stats is not None:
+    stats.setdefault(phase, []).append(elapsed_ns)
+
+
+def print_histogram(samples: list[int], indent: str = '    ') -> None:
+  ''' Print a power-of-two latency histogram of nanosecond samples '''
+  buckets: dict[int, int] = {}
+  for sample in samples:
+    bucket = max(sample, 1).bit_length()
+    buckets[bucket] = buckets.get(bucket, 0) + 1
+
+  peak = max(buckets.values())
+  for bucket in range(min(buckets), max(buckets) + 1):
+    count = buckets.get(bucket, 0)
+    bar = '#' * round(40 * count / peak)
+    print(f'{indent}< {formatNs(1 << bucket):>9} {count:>8} {bar}')
+
+
+def print_stats(stats: StatsType, histograms: bool = False) -> None:
+  for phase in ('setup', 'resolve', 'build', 'send'):
+    samples = stats.get(phase)
+    if not samples:
+      continue
+
+    ordered = sorted(samples)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[min(len(ordered) - 1, len(ordered) * 99 // 100)]
+    print(
+      f'{phase:<8} total {formatNs(sum(ordered)):>9}  n={len(ordered):<7} '
+      f'p50 {formatNs(p50):>9}  p99 {formatNs(p99):>9}  max {formatNs(ordered[-1]):>9}'
+    )
+
+    if histograms and len(ordered) > 1:
+      print_histogram(ordered)
+
+
+def run_benchmark(sizes: list[int]) -> None:
+  ''' Build and send packets to a loopback UDP sink at each target count '''
+  import random
+  import threading
+
+  # The drainer runs until told to stop, then empties what is still queued, so a slow build
+  # or send never ends it early the way an idle timeout would.
+  def drain(sink: socket.socket, sending_done: threading.Event, received: list[int]) -> None:
+    while True:
+      try:
+        sink.recv(2048)
+      except TimeoutError:
+        if sending_done.is_set():
+          return
+        continue
+      except OSError:
+        return
+      received[0] += 1
+
+  for size in sizes:
+    macs = [random.randbytes(6).hex(':') for _ in range(size)]
+    print(f'\n== {size} target(s) ==')
+
+    for label, builder in (('concat', build_packet_concat), ('fromhex', build_packet)):
+      start_ns = time.perf_counter_ns()
+      for mac in macs:
+        builder(mac)
+
+      elapsed_ns = max(time.perf_counter_ns() - start_ns, 1)
+      print(f'build {label:<9}{size * 1e9 / elapsed_ns:>14,.0f} packets/s  ({formatNs(elapsed_ns)})')
+
+    stats: StatsType = {}
+    targets = [make_target(mac, None) for mac in macs]
+
+    start_ns = time.perf_counter_ns()
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+    sink.bind(('127.0.0.1', 0))
+    sink.settimeout(0.05)
+    sock = open_socket(None)
+    record_sample(stats, 'setup', time.perf_counter_ns() - start_ns)
+
+    build_packets(targets, stats)
+
+    received = [0]
+    sending_done = threading.Event()
+    drainer = threading.Thread(target=drain, args=(sink, sending_done, received), daemon=True)
+    drainer.start()
+
+    start_ns = time.perf_counter_ns()
+    sent = send_packets(sock, targets, stats, address=sink.getsockname())
+    elapsed_ns = max(time.perf_counter_ns() - start_ns, 1)
+
+    sending_done.set()
+    sock.close()
+    drainer.join()
+    sink.close()
+
+    print(
+      f'send  loopback {sent * 1e9 / elapsed_ns:>14,.0f} packets/s  ({formatNs(elapsed_ns)}, '
+      f'{received[0]} of {sent} received)'
+    )
+    print_stats(stats, histograms=True)
+
+
+def load_plan(path: str, broadcast: str = BROADCAST) -> PlanType:
+  ''' Read a wake plan, check every host and resolve each stage's group selectors to hosts '''
+  with open(path, encoding='utf-8') as planFile:
+    plan = json.load(planFile)
+
+  # Build every target now, so a bad address stops the plan before the first wave (and
+  # shows up under --dry-run) instead of failing halfway through the schedule.
+  hosts = plan.get('hosts', [])
+  for index, host in enumerate(hosts):
+    label = host.get('name', f'#{index + 1}')
+    if 'mac' not in host:
+      raise SystemExit(f'Wake plan {path}: host {label!r} has no "mac".')
+
+    try:
+      host['mac'] = normalize_mac(host['mac'])
+      host['target'] = make_target(host['mac'], host.get('subnet'), broadcast)
+    except ValueError as error:
+      raise SystemExit(f'Wake plan {path}: host {label!r}: {error}') from None
+
+    host.setdefault('name', host['mac'])
+
+  stages = plan.get('stages', [])
+  if not stages:
+    raise SystemExit(f'Wake plan {path} has no stages.')
+
+  known = {host['name'] for host in hosts}.union(*(host.get('groups', ()) for host in hosts))
+
+  for index, stage in enumerate(stages):
+    stage.setdefault('name', f'stage {index + 1}')
+    selectors = set(stage.get('select', ['*']))
+
+    unknown = sorted(selectors - known - {'*'})
+    if unknown:
+      raise SystemExit(
+        f'Stage {stage["name"]!r} selects names that match no host or group: {", ".join(unknown)}'
+      )
+
+    stage['hosts'] = [
+      host for host in hosts
+      if '*' in selectors or host['name'] in selectors or selectors.intersection(host.get('groups', ()))
+    ]
+
+    if stage.get('waitForPrevious') and index:
+      unverifiable = [host['name'] for host in stages[index - 1]['hosts'] if not host.get('ip')]
+      if unverifiable:
+        raise SystemExit(
+          f'Stage {stage["name"]!r} waits for {stages[index - 1]["name"]!r}, '
+          f'but these hosts have no "ip" to verify: {", ".join(unverifiable)}'
+        )
+
+  return plan
+
+
+def schedule(queue: EventQueueType, due: float, action: Callable[[], None]) -> None:
+  heapq.heappush(queue, (due, next(_EVENT_SEQUENCE), action))
+
+
+def run_schedule(
+  queue: EventQueueType, clock: Callable[[], float], sleep: Callable[[float], None]
+) -> None:
+  ''' Run queued actions in due order, sleeping until the next one is due '''
+  while queue:
+    due, _, action = heapq.heappop(queue)
+    delay = due - clock()
+    if delay > 0:
+      sleep(delay)
+
+    action()
+
+
+def probe_host(host: PlanType, timeout: float) -> bool:
+  try:
+    with socket.create_connection((host['ip'], int(host.get('checkPort', 22))), timeout=timeout):
+      return True
+  except OSError:
+    return False
+
+
+def run_plan(plan: PlanType, interfaces: list[InterfaceType], dry_run: bool = False) -> int:
+  ''' Wake each stage in waves, optionally waiting for the previous stage to answer '''
+  stages: list[PlanType] = plan['stages']
+  queue: EventQueueType = []
+  failures: list[str] = []
+
+  clock: Callable[[], float] = time.monotonic
+  sleep: Callable[[float], None] = time.sleep
+
+  if dry_run:
+    virtual_now = [0.0]
+
+    def clock() -> float:
+      return virtual_now[0]
+
+    def sleep(delay: float) -> None:
+      virtual_now[0] += delay
+
+  start_time = clock()
+  prefix = '[DRY RUN] ' if dry_run else ''
+  probe_pool = ThreadPoolExecutor(max_workers=int(plan.get('probeWorkers', 64)))
+
+  # Every wave reuses one bound socket per interface and one send pool for the whole plan.
+  sockets: SocketCacheType = {}
+  send_pool = ThreadPoolExecutor(max_workers=len(interfaces) + 1)
+
+  def log(message: str) -> None:
+    print(f'{prefix}[+{clock() - start_time:8.1f}s] {message}')
+
+  def start_stage(index: int) -> None:
+    if failures or index >= len(stages):
+      return
+
+    stage = stages[index]
+    hosts = stage['hosts']
+    wave_size = max(1, int(stage.get('waveSize', len(hosts) or 1)))
+    wave_delay = float(stage.get('waveDelay', 0))
+    waves = [hosts[offset: offset + wave_size] for offset in range(0, len(hosts), wave_size)]
+    now = clock()
+
+    log(f'Stage {stage["name"]!r}: {len(hosts)} host(s) in {len(waves)} wave(s)')
+
+    for wave_index, wave in enumerate(waves):
+      schedule(
+        queue,
+        now + wave_index * wave_delay,
+        lambda wave=wave, wave_index=wave_index: send_wave(stage, wave, wave_index, len(waves)),
+      )
+
+    last_wave = now + max(len(waves) - 1, 0) * wave_delay
+    next_stage = stages[index + 1] if index + 1 < len(stages) else None
+
+    if next_stage is not None and next_stage.get('waitForPrevious'):
+      deadline = last_wave + float(next_stage.get('verifyTimeout', 600))
+      schedule(queue, last_wave, lambda: verify_stage(index, list(hosts), deadline))
+    else:
+      next_start = last_wave + float(stage.get('stageDelay', wave_delay))
+      schedule(queue, next_start, lambda: start_stage(index + 1))
+
+  def send_wave(stage: PlanType, wave: list[PlanType], wave_index: int, wave_count: int) -> None:
+    targets = [host['target'] for host in wave]
+    sent = len(targets)
+
+    if not dry_run:
+      build_packets(targets)
+      sent = send_routes(route_targets(targets, interfaces), sockets=sockets, pool=send_pool)
+
+    log(f'Stage {stage["name"]!r} wave {wave_index + 1}/{wave_count}: sent {sent} of {len(targets)}')
+
+  def verify_stage(index: int, pending: list[PlanType], deadline: float) -> None:
+    stage = stages[index]
+    interval = float(stages[index + 1].get('verifyInterval', 5))
+
+    if not dry_run:
+      answers = probe_pool.map(lambda host: probe_host(host, min(interval, 2.0)), pending)
+      pending = [host for host, up in zip(pending, answers, strict=True) if not up]
+    else:
+      pending = []
+
+    if not pending:
+      log(f'Stage {stage["name"]!r} verified up')
+      start_stage(index + 1)
+      return
+
+    if clock() >= deadline:
+      names = ', '.join(host['name'] for host in pending)
+      failures.append(stage['name'])
+      log(f'Stage {stage["name"]!r} not up before timeout, stopping plan: {names}')
+      return
+
+    schedule(queue, clock() + interval, lambda: verify_stage(index, pending, deadline))
+
+  start_stage(0)
+
+  try:
+    run_schedule(queue, clock, sleep)
+  finally:
+    probe_pool.shutdown(cancel_futures=True)
+    send_pool.shutdown()
+    close_sockets(sockets)
+
+  return 1 if failures else 0
+
+
+def load_neighbor_cache(path: str) -> NeighborCacheType:
+  ''' Hosts keyed by MAC address, plus what was last read from each source file '''
+  try:
+    with open(path, encoding='utf-8') as cache_file:
+      cache = json.load(cache_file)
+  except (OSError, ValueError):
+    cache = None
+
+  if not isinstance(cache, dict) or cache.get('version') != NEIGHBOR_CACHE_VERSION:
+    cache = new_neighbor_cache()
+
+  return cache
+
+
+def new_neighbor_cache() -> NeighborCacheType:
+  return {'version': NEIGHBOR_CACHE_VERSION, 'hosts': {}, 'sources': {}}
+
+
+def save_neighbor_cache(path: str, cache: NeighborCacheType) -> None:
+  try:
+    writeJsonAtomic(path, cache, indent=1, sort_keys=True)
+  except OSError as error:
+    print(f'Could not save the host cache {path}: {error}')
+
+
+def parse_arp_table(data: bytes, seen: float) -> list[NeighborType]:
+  ''' /proc/net/arp: IP address, HW type, Flags, HW address, Mask, Device '''
+  neighbors: list[NeighborType] = []
+
+  for line in data.decode(errors='replace').splitlines()[1:]:
+    fields = line.split()
+    try:
+      complete = len(fields) >= 6 and int(fields[2], 16) & ATF_COM
+    except ValueError:
+      continue
+
+    if complete:
+      neighbors.append({'mac': fields[3], 'ip': fields[0], 'hostname': None, 'seen': seen})
+
+  return neighbors
+
+
+def parse_ip_neigh(data: bytes, seen: float) -> list[NeighborType]:
+  ''' "ip neigh" output: "<ip> dev <name> lladdr <mac> [router] <STATE>" '''
+  neighbors: list[NeighborType] = []
+
+  for line in data.decode(errors='replace').splitlines():
+    fields = line.split()
+    if 'lladdr' not in fields or ':' in fields[0] or fields[-1] in ('FAILED', 'INCOMPLETE'):
+      continue
+
+    mac_index = fields.index('lladdr') + 1
+    if mac_index < len(fields):
+      neighbors.append({'mac': fields[mac_index], 'ip': fields[0], 'hostname': None, 'seen': seen})
+
+  return neighbors
+
+
+def parse_lease_time(text: str) -> float | None:
+  ''' ISC lease times are "<weekday> YYYY/MM/DD HH:MM:SS" in UTC, or "epoch <seconds>" '''
+  kind, _, value = text.partition(' ')
+  if kind == 'epoch':
+    return float(value.split()[0])
+
+  try:
+    moment = datetime.datetime.strptime(value.strip(), '%Y/%m/%d %H:%M:%S')
+  except ValueError:
+    return None
+
+  return moment.replace(tzinfo=datetime.UTC).timestamp()
+
+
+def parse_isc_leases(data: bytes, seen: float) -> tuple[list[NeighborType], int]:
+  ''' Return the leases in data and how many bytes of complete lease blocks were consumed '''
+  neighbors: list[NeighborType] = []
+  consumed = 0
+
+  for match in ISC_LEASE.finditer(data):
+    consumed = match.end()
+    fields = {
+      name.decode(): value.decode(errors='replace').strip()
+      for name, value in ISC_LEASE_FIELDS.findall(match.group(2))
+    }
+
+    if 'hardware ethernet' not in fields:
+      continue
+
+    lease_time = parse_lease_time(fields.get('cltt') or fields.get('starts') or '')
+    neighbors.append({
+      'mac': fields['hardware ethernet'],
+      'ip': match.group(1).decode(),
+      'hostname': fields.get('client-hostname', '').strip('"') or None,
+      'seen': lease_time if lease_time is not None else seen,
+    })
+
+  return neighbors, consumed
+
+
+def parse_dnsmasq_leases(data: bytes, seen: float) -> list[NeighborType]:
+  ''' dnsmasq: "<expiry> <mac> <ip> <hostname or *> <client id>" per line '''
+  neighbors: list[NeighborType] = []
+
+  for line in data.decode(errors='replace').splitlines():
+    fields = line.split()
+    # IPv6 leases carry an IAID instead of a MAC and are skipped when the cache is merged.
+    if len(fields) >= 4 and fields[0] != 'duid':
+      hostname = None if fields[3] == '*' else fields[3]
+      neighbors.append({'mac': fields[1], 'ip': fields[2], 'hostname': hostname, 'seen': seen})
+
+  return neighbors
+
+
+def read_source(
+  path: str, sources: dict[str, Any], append_only: bool = False
+) -> tuple[bytes, int, float] | None:
+  ''' Return (data, offset, mtime) read since the last refresh, or None if the file is unchanged
+
+  Append-only files resume at the offset stored for them, unless the file was replaced or
+  truncated. procfs tables report a size of 0 and are always read.
+  '''
+  with open(path, 'rb') as source_file:
+    info = os.fstat(source_file.fileno())
+    state = sources.get(path, {})
+    fingerprint = {'inode': info.st_ino, 'size': info.st_size, 'mtime': info.st_mtime_ns}
+
+    if info.st_size and all(state.get(key) == value for key, value in fingerprint.items()):
+      return None
+
+    offset = 0
+    if append_only and state.get('inode') == info.st_ino and state.get('offset', 0) <= info.st_size:
+      offset = state.get('offset', 0)
+
+    source_file.seek(offset)
+    data = source_file.read()
+
+  sources[path] = {**state, **fingerprint, 'offset': offset + len(data)}
+
+  return data, offset, info.st_mtime
+
+
+def run_ip_neigh() -> bytes:
+  try:
+    result = subprocess.run(
+      ['ip', '-4', 'neigh', 'show'], capture_output=True, check=False, timeout=5
+    )
+  except (OSError, subprocess.SubprocessError):
+    return b''
+
+  return result.stdout
+
+
+def subnet_for(ip: str, interfaces: list[InterfaceType]) -> str | None:
+  try:
+    address = ipaddress.IPv4Address(ip)
+  except ValueError:
+    return None
+
+  for iface in interfaces:
+    if address in iface['network']:
+      return str(iface['network'])
+
+  return None
+
+
+def merge_neighbors(
+  cache: NeighborCacheType, neighbors: list[NeighborType], interfaces: list[InterfaceType]
+) -> tuple[int, int]:
+  ''' Fold neighbor entries into the cache; newer sightings win. Returns (added, updated) '''
+  hosts: dict[str, NeighborType] = cache['hosts']
+  added: set[str] = set()
+  updated: set[str] = set()
+
+  for neighbor in neighbors:
+    try:
+      mac = normalize_mac(neighbor['mac'])
+    except ValueError:
+      continue
+
+    if mac == '00:00:00:00:00:00':
+      continue
+
+    record = hosts.get(mac)
+    if record is None:
+      record = hosts[mac] = {'ip': None, 'hostname': None, 'subnet': None, 'lastSeen': 0}
+      added.add(mac)
+    before = (record['ip'], record['hostname'], record['subnet'])
+
+    # Older sightings, such as expired leases read after a live ARP entry, only fill gaps.
+    newer = neighbor['seen'] >= record['lastSeen']
+    subnet = subnet_for(neighbor['ip'], interfaces)
+
+    if newer or not record['ip']:
+      record['ip'] = neighbor['ip']
+    if neighbor['hostname'] and (newer or not record['hostname']):
+      record['hostname'] = neighbor['hostname']
+    if subnet and (newer or not record['subnet']):
+      record['subnet'] = subnet
+    if newer:
+      record['lastSeen'] = neighbor['seen']
+
+    if mac not in added and before != (record['ip'], record['hostname'], record['subnet']):
+      updated.add(mac)
+
+  return len(added), len(updated)
+
+
+def refresh_neighbors(
+  cache: NeighborCacheType,
+  interfaces: list[InterfaceType],
+  arp_files: list[str],
+  neigh_files: list[str],
+  lease_files: list[str],
+  live_neigh: bool = True,
+) -> dict[str, int]:
+  ''' Read the sources that changed since the last refresh into the cache '''
+  counts = {'read': 0, 'unchanged': 0, 'missing': 0, 'entries': 0, 'added': 0, 'updated': 0}
+  sources: dict[str, Any] = cache['sources']
+  now = time.time()
+  neighbors: list[NeighborType] = []
+
+  for path, parser in [
+    *((path, parse_arp_table) for path in arp_files),
+    *((path, parse_ip_neigh) for path in neigh_files),
+    *((path, None) for path in lease_files),
+  ]:
+    lease_format = sources.get(path, {}).get('format')
+
+    try:
+      result = read_source(path, sources, append_only=lease_format == 'isc')
+    except OSError:
+      counts['missing'] += 1
+      continue
+
+    if result is None:
+      counts['unchanged'] += 1
+      continue
+
+    counts['read'] += 1
+    data, offset, mtime = result
+
+    if parser is not None:
+      neighbors.extend(parser(data, now))
+      continue
+
+    if lease_format is None and (ISC_LEASE.search(data) or b'authoring-byte-order' in data):
+      lease_format = 'isc'
+    elif lease_format is None and data.strip():
+      lease_format = 'dnsmasq'
+
+    if lease_format == 'isc':
+      # Stop after the last complete lease block so a block being appended is read next time.
+      leases, consumed = parse_isc_leases(data, mtime)
+      sources[path]['offset'] = offset + consumed
+      neighbors.extend(leases)
+    elif lease_format == 'dnsmasq':
+      # dnsmasq rewrites the whole file on each change, so every lease in it is current.
+      neighbors.extend(parse_dnsmasq_leases(data, mtime))
+
+    sources[path]['format'] = lease_format
+
+  if live_neigh:
+    counts['read'] += 1
+    neighbors.extend(parse_ip_neigh(run_ip_neigh(), now))
+
+  counts['entries'] = len(neighbors)
+  counts['added'], counts['updated'] = merge_neighbors(cache, neighbors, interfaces)
+
+  return counts
+
+
+def lookup_host(cache: NeighborCacheType, name: str) -> NeighborType | None:
+  ''' Most recently seen host with this IP address or hostname
+
+  Exact hostname matches win. Only when there is none does a name match on first labels, so
+  "hv1" finds "hv1.lan" and "hv1.lan" finds "hv1", but "web.a.example" never finds "web.b.example".
+  '''
+  query = name.lower()
+  records = [{'mac': mac, **record} for mac, record in cache['hosts'].items()]
+
+  try:
+    ipaddress.ip_address(query)
+    matches = [record for record in records if record.get('ip') == query]
+  except ValueError:
+    hostnames = [(record, (record.get('hostname') or '').lower()) for record in records]
+    matches = [record for record, hostname in hostnames if hostname == query]
+
+    if not matches:
+      short_query = query.partition('.')[0]
+      matches = [
+        record for record, hostname in hostnames
+        if hostname and (hostname == short_query or ('.' not in query and hostname.partition('.')[0] == query))
+      ]
+
+  return max(matches, key=lambda record: record['lastSeen'], default=None)
+
+
+def resolve_target(
+  text: str, broadcast: str, cache: NeighborCacheType, refresh: Callable[[], None]
+) -> TargetType:
+  ''' MAC[@SUBNET] as given, or a cached host by name or IP, refreshing the cache on a miss '''
+  name, _, subnet = text.partition('@')
+  if is_mac(name):
+    return parse_target(text, broadcast)
+
+  record = lookup_host(cache, name)
+  if record is None:
+    refresh()
+    record = lookup_host(cache, name)
+
+  if record is None:
+    raise SystemExit(f'Unknown host {name!r}: not in the host cache, the neighbor table or leases.')
+
+  target = make_target(record['mac'], subnet or record['subnet'], broadcast)
+  target['name'] = name
+
+  return target
+
+
+def print_hosts(cache: NeighborCacheType) -> None:
+  hosts = sorted(
+    cache['hosts'].items(),
+    key=lambda item: ((item[1]['hostname'] or '~').lower(), item[1]['ip'] or ''),
+  )
+
+  for mac, record in hosts:
+    seen = time.strftime('%Y-%m-%d %H:%M', time.localtime(record['lastSeen']))
+    print(
+      f'{record["hostname"] or "-":<24} {record["ip"] or "-":<16} {mac}  '
+      f'{record["subnet"] or "-":<18} {seen}'
+    )
+
+  print(f'\n{len(hosts)} host(s) cached.')
+
+
+def interact():
+  ''' Using python -i wol.py it will execute globals and drop into REPL '''
+  import code
+  code.InteractiveConsole(locals=globals()).interact()
+
+
+# If the ${FILE} is run (instead of imported as a module), call the main() function:
+if __name__ == '__main__':
+  # Register the function to execute on ending the script
+  raise SystemExit(main())